@@ -0,0 +1,303 @@
+import asyncio
+import importlib.util
+import inspect
+import logging
+from collections import deque
+
+import aiohttp
+
+from client_pool import ClientPool
+from language_registry import to_backend_code
+
+logger = logging.getLogger(__name__)
+
+# Registered backend classes by name
+BACKENDS = {}
+
+def register_backend(name):
+    """Class decorator that adds a backend to the registry under the given name"""
+    def decorator(cls):
+        cls.name = name
+        BACKENDS[name] = cls
+        return cls
+    return decorator
+
+def create_backend(name, executor, **options):
+    """
+    Build a registered backend
+
+    Args:
+        name (str): Registered backend name
+        executor: TranslationExecutor for backends that run blocking clients
+        **options: Backend-specific settings
+
+    Returns:
+        TranslationBackend: The backend, or None if it is unknown or its library is missing
+    """
+    backend_class = BACKENDS.get(name)
+    if not backend_class:
+        logger.error(f"Unknown translation backend '{name}' (available: {', '.join(BACKENDS)})")
+        return None
+
+    if not backend_class.is_available():
+        logger.warning(f"Translation backend '{name}' is not installed, skipping it")
+        return None
+
+    return backend_class(executor=executor, **options)
+
+class TranslationBackend:
+    """Base class for translation backends"""
+
+    name = None
+    # Library the backend needs, checked before it is created
+    requires_module = None
+    # Whether requests spend the service's shared (network) rate limit
+    rate_limited = True
+    # Whether the backend needs an explicit source language instead of 'auto'
+    requires_source = False
+    # Recent successful latencies kept for percentile estimates
+    LATENCY_WINDOW = 100
+
+    def __init__(self, executor=None, **options):
+        self._executor = executor
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self._requests = 0
+        self._failures = 0
+
+    @classmethod
+    def is_available(cls):
+        """Check whether the backend's library can be imported"""
+        return cls.requires_module is None or importlib.util.find_spec(cls.requires_module) is not None
+
+    async def translate(self, text, target_language, source_language='auto'):
+        """
+        Translate text
+
+        Args:
+            text (str): Text to translate
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+
+        Returns:
+            tuple: (translated text, detected source language code or None)
+        """
+        raise NotImplementedError
+
+    def record_result(self, latency, success):
+        """Record the outcome of one request for latency percentiles and stats"""
+        self._requests += 1
+        if success:
+            self._latencies.append(latency)
+        else:
+            self._failures += 1
+
+    def record_cancelled(self, latency):
+        """Record a request abandoned after a hedge; it was at least this slow, so keep it in the percentile window"""
+        self._requests += 1
+        self._latencies.append(latency)
+
+    def latency_percentile(self, percentile, min_samples=20):
+        """
+        Get a latency percentile over recent successful requests
+
+        Returns:
+            float: Latency in seconds, or None until enough samples exist
+        """
+        if len(self._latencies) < min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+    def get_stats(self):
+        """
+        Get request counters and latency percentiles
+
+        Returns:
+            dict: Backend statistics
+        """
+        p50 = self.latency_percentile(0.5, min_samples=1)
+        p95 = self.latency_percentile(0.95, min_samples=1)
+        return {
+            'name': self.name,
+            'requests': self._requests,
+            'failures': self._failures,
+            'p50_latency': round(p50, 3) if p50 is not None else None,
+            'p95_latency': round(p95, 3) if p95 is not None else None,
+        }
+
+    async def close(self):
+        """Release any resources held by the backend"""
+
+class ThreadedBackend(TranslationBackend):
+    """Backend wrapping a blocking client, run on the service's dedicated executor"""
+
+    async def translate(self, text, target_language, source_language='auto'):
+        return await self._executor.run(self._translate_sync, text, target_language, source_language)
+
+    def _translate_sync(self, text, target_language, source_language):
+        """Blocking translation call, runs on an executor thread"""
+        raise NotImplementedError
+
+@register_backend('deep-translator')
+class DeepTranslatorBackend(ThreadedBackend):
+    """
+    Google Translate through deep-translator's GoogleTranslator
+
+    deep-translator sends every request through the module-level requests.get, so
+    no connection is kept warm between calls. Use the google-http backend, which
+    keeps pooled keep-alive connections, where connection reuse matters.
+    """
+
+    requires_module = 'deep_translator'
+
+    def _translate_sync(self, text, target_language, source_language):
+        from deep_translator import GoogleTranslator
+
+        # Create translator for specific language pair
+        translator = GoogleTranslator(
+            source=to_backend_code(source_language),
+            target=to_backend_code(target_language)
+        )
+        return translator.translate(text), None
+
+@register_backend('googletrans')
+class GoogletransBackend(ThreadedBackend):
+    """Google Translate through the googletrans library"""
+
+    requires_module = 'googletrans'
+
+    def __init__(self, executor=None, client_pool_size=4, client_idle_timeout=300.0, **options):
+        """
+        Args:
+            executor: TranslationExecutor the blocking calls run on
+            client_pool_size (int): Most idle Translators kept for reuse
+            client_idle_timeout (float): Seconds an idle Translator is kept before it is dropped
+        """
+        super().__init__(executor=executor, **options)
+        # Releases before 4.0.2 keep an HTTP client with keep-alive connections on the
+        # Translator, so reusing one skips the TCP and TLS handshakes
+        self._clients = ClientPool(self._create_client, max_size=client_pool_size, idle_timeout=client_idle_timeout)
+
+    def _create_client(self, key):
+        """Build a Translator, runs on an executor thread; Translators are not tied to a language pair"""
+        from googletrans import Translator
+
+        return Translator()
+
+    def _translate_sync(self, text, target_language, source_language):
+        from googletrans import Translator
+
+        dest, src = to_backend_code(target_language), to_backend_code(source_language)
+        # googletrans 4.0.2+ is async: its client is bound to the event loop asyncio.run
+        # creates for the call, so it cannot be reused and gets a fresh Translator each time
+        if inspect.iscoroutinefunction(Translator.translate):
+            result = asyncio.run(Translator().translate(text, dest=dest, src=src))
+        else:
+            with self._clients.lease(None) as translator:
+                result = translator.translate(text, dest=dest, src=src)
+
+        return result.text, getattr(result, 'src', None)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['client_pool'] = self._clients.get_stats()
+        return stats
+
+    async def close(self):
+        """Drop the pooled Translators"""
+        self._clients.clear()
+
+@register_backend('google-http')
+class GoogleHTTPBackend(TranslationBackend):
+    """Google Translate over a shared aiohttp session with pooled keep-alive connections"""
+
+    BASE_URL = 'https://translate.googleapis.com/translate_a/single'
+    # Above this many characters the text goes in a POST body instead of the query string
+    MAX_GET_LENGTH = 1500
+
+    def __init__(self, executor=None, timeout=5.0, pool_size=10, keepalive_timeout=60, **options):
+        """
+        Args:
+            executor: Unused, the backend runs natively on the event loop
+            timeout (float): Per-request timeout in seconds
+            pool_size (int): Maximum pooled connections
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse
+        """
+        super().__init__(executor=executor, **options)
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._session = None
+
+    def _get_session(self):
+        """Get the shared session, creating it on first use inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                headers={'User-Agent': 'Mozilla/5.0 (compatible; EchoLang/1.0)'}
+            )
+        return self._session
+
+    async def translate(self, text, target_language, source_language='auto'):
+        """
+        Translate text with a single HTTP round trip
+
+        Args:
+            text (str): Text to translate
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+
+        Returns:
+            tuple: (translated text, detected source language code or None)
+
+        Raises:
+            TimeoutError: The request did not finish within the timeout
+            ConnectionError: The connection to the endpoint failed
+            RuntimeError: The endpoint answered with an error status or an unexpected body
+        """
+        session = self._get_session()
+        params = {'client': 'gtx', 'sl': to_backend_code(source_language), 'tl': to_backend_code(target_language), 'dt': 't'}
+
+        try:
+            if len(text) <= self.MAX_GET_LENGTH:
+                request = session.get(self.BASE_URL, params={**params, 'q': text})
+            else:
+                request = session.post(self.BASE_URL, params=params, data={'q': text})
+
+            async with request as response:
+                if response.status == 429:
+                    raise RuntimeError("HTTP 429: rate limit reached")
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP {response.status} from translation endpoint")
+                data = await response.json(content_type=None)
+
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Translation request timeout after {self._timeout}s")
+        except aiohttp.ClientConnectionError as e:
+            raise ConnectionError(f"Translation connection error: {e}")
+
+        try:
+            translated_text = ''.join(segment[0] for segment in data[0] if segment and segment[0])
+            detected_source = data[2] if len(data) > 2 and isinstance(data[2], str) else None
+        except (TypeError, IndexError) as e:
+            raise RuntimeError(f"Unexpected translation response format: {e}")
+
+        return translated_text, detected_source
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['timeout'] = self._timeout
+        stats['pool_size'] = self._pool_size
+        stats['session_open'] = self._session is not None and not self._session.closed
+        return stats
+
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        if self._session and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,79 @@
+"""
+Per-request latency of the googletrans backend with a new Translator per request
+(the old behaviour, and a cold HTTP connection each time) versus Translators
+leased from the backend's pool, which keep their keep-alive connections warm
+
+Usage:
+    python benchmark_client_pool.py [--requests N] [--target CODE] [--offline]
+
+--offline skips the network and times only getting a Translator, for machines
+without internet access; without it every request is a real translation.
+
+Only googletrans releases before 4.0.2 are synchronous and pooled; newer releases
+bind their client to one event loop, so there is nothing to compare.
+"""
+import argparse
+import inspect
+import statistics
+import time
+
+from backends import GoogletransBackend
+from language_registry import to_backend_code
+
+SAMPLE_TEXT = "Welcome to the server! Please read the rules before posting."
+
+def measure(call, requests):
+    """Run call the given number of times and return each run's latency in milliseconds"""
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+def report(label, latencies):
+    """Print mean, p50 and p95 latency"""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<12} mean {statistics.mean(ordered):8.3f} ms   p50 {statistics.median(ordered):8.3f} ms   p95 {p95:8.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=50, help="requests per run")
+    parser.add_argument('--target', default='es', help="target language code")
+    parser.add_argument('--offline', action='store_true', help="time getting a Translator only, without translating")
+    args = parser.parse_args()
+
+    from googletrans import Translator
+    if inspect.iscoroutinefunction(Translator.translate):
+        print("googletrans 4.0.2+ is async and creates a Translator per request; the pool is not used")
+        return
+
+    backend = GoogletransBackend()
+    dest = to_backend_code(args.target)
+
+    if args.offline:
+        def fresh():
+            backend._create_client(None)
+
+        def pooled():
+            with backend._clients.lease(None):
+                pass
+    else:
+        def fresh():
+            backend._create_client(None).translate(SAMPLE_TEXT, dest=dest)
+
+        def pooled():
+            backend._translate_sync(SAMPLE_TEXT, args.target, 'auto')
+
+    # One untimed request each, so imports and DNS do not land in the first sample
+    fresh()
+    pooled()
+
+    print(f"{args.requests} requests to {args.target}{' (offline)' if args.offline else ''}")
+    report('new client', measure(fresh, args.requests))
+    report('pooled', measure(pooled, args.requests))
+    print(f"pool: {backend._clients.get_stats()}")
+
+if __name__ == '__main__':
+    main()
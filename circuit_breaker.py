@@ -0,0 +1,125 @@
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """Per-backend circuit breaker (closed -> open -> half-open) driven by backend health failures"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    # Failure categories that count against a backend's health
+    TRIP_CATEGORIES = frozenset({'rate_limit', 'quota', 'timeout'})
+    # Categories that open the breaker on the first occurrence
+    IMMEDIATE_TRIP_CATEGORIES = frozenset({'quota'})
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1):
+        """
+        Args:
+            name (str): Backend name, used in logs
+            failure_threshold (int): Consecutive health failures that open the breaker
+            recovery_timeout (float): Seconds the breaker stays open before allowing a probe
+            half_open_max_calls (int): Probe requests allowed while half-open
+        """
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._last_probe_at = 0.0
+        self._times_opened = 0
+        self._rejected = 0
+        self._last_failure_category = None
+
+    @property
+    def state(self):
+        """Current state, moving from open to half-open once the recovery timeout has passed"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+            logger.info(f"Circuit breaker for {self._name} is half-open, allowing a probe request")
+        return self._state
+
+    def allow_request(self):
+        """
+        Check whether a request may go to the backend, claiming a probe slot when half-open
+
+        Returns:
+            bool: True if the request may be sent
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+
+        if state == self.HALF_OPEN:
+            now = time.monotonic()
+            # A probe that never reported back (e.g. cancelled) must not wedge the breaker
+            if self._half_open_calls >= self._half_open_max_calls and now - self._last_probe_at >= self._recovery_timeout:
+                self._half_open_calls = 0
+
+            if self._half_open_calls < self._half_open_max_calls:
+                self._half_open_calls += 1
+                self._last_probe_at = now
+                return True
+
+        self._rejected += 1
+        return False
+
+    def record_success(self):
+        """Record a request that reached the backend and got an answer"""
+        if self._state == self.HALF_OPEN:
+            logger.info(f"Circuit breaker for {self._name} closed after successful probe")
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+
+    def record_failure(self, category):
+        """
+        Record a failed request
+
+        Args:
+            category (str): Failure category; only health categories affect the breaker
+        """
+        if category not in self.TRIP_CATEGORIES:
+            # The backend answered, it just could not translate this request
+            self.record_success()
+            return
+
+        self._last_failure_category = category
+        self._consecutive_failures += 1
+
+        if (self._state == self.HALF_OPEN
+                or category in self.IMMEDIATE_TRIP_CATEGORIES
+                or self._consecutive_failures >= self._failure_threshold):
+            self._open(category)
+
+    def _open(self, category):
+        """Open the breaker so requests fail fast until the recovery timeout passes"""
+        if self._state != self.OPEN:
+            self._times_opened += 1
+            logger.warning(f"Circuit breaker for {self._name} opened after {category} "
+                           f"({self._consecutive_failures} consecutive failures)")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def get_stats(self):
+        """
+        Get breaker state and counters
+
+        Returns:
+            dict: Breaker statistics
+        """
+        state = self.state
+        return {
+            'state': state,
+            'consecutive_failures': self._consecutive_failures,
+            'times_opened': self._times_opened,
+            'rejected_requests': self._rejected,
+            'last_failure_category': self._last_failure_category,
+            'retry_in': round(max(0.0, self._recovery_timeout - (time.monotonic() - self._opened_at)), 1)
+            if state == self.OPEN else 0.0,
+        }
@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+class ClientPool:
+    """Thread-safe pool of warm translator clients, lent out one caller at a time"""
+
+    def __init__(self, factory, max_size=32, idle_timeout=300.0):
+        """
+        Args:
+            factory: Callable building a new client from a key
+            max_size (int): Most idle clients kept across all keys
+            idle_timeout (float): Seconds an idle client is kept before it is dropped
+        """
+        self._factory = factory
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # (key, serial) -> (client, returned_at), oldest first; the serial keeps idle clients for one key apart
+        self._idle = OrderedDict()
+        self._serial = 0
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+
+    @contextmanager
+    def lease(self, key):
+        """
+        Borrow a client for a key, returning it to the pool afterwards
+
+        Clients are never shared between concurrent callers, since translator
+        objects keep per-request state. A client whose call raised is dropped
+        rather than returned, in case the failure left it broken.
+
+        Args:
+            key: Pool key for clients bound to something (e.g. a language pair), or None
+
+        Yields:
+            The client
+        """
+        client = self._acquire(key)
+        try:
+            yield client
+        except BaseException:
+            with self._lock:
+                self._evicted += 1
+            raise
+        self._release(key, client)
+
+    def _acquire(self, key):
+        """Take the most recently returned idle client for the key, or build a new one"""
+        with self._lock:
+            self._evict_expired()
+            for pool_key in reversed(self._idle):
+                if pool_key[0] == key:
+                    client, _ = self._idle.pop(pool_key)
+                    self._reused += 1
+                    return client
+            self._created += 1
+
+        return self._factory(key)
+
+    def _release(self, key, client):
+        """Return a client to the pool, dropping the oldest idle client when full"""
+        with self._lock:
+            self._serial += 1
+            self._idle[(key, self._serial)] = (client, time.monotonic())
+            while len(self._idle) > self._max_size:
+                self._idle.popitem(last=False)
+                self._evicted += 1
+
+    def _evict_expired(self):
+        """Drop clients idle for longer than the idle timeout; the caller holds the lock"""
+        cutoff = time.monotonic() - self._idle_timeout
+        while self._idle:
+            _, (_, returned_at) = next(iter(self._idle.items()))
+            if returned_at > cutoff:
+                break
+            self._idle.popitem(last=False)
+            self._evicted += 1
+
+    def clear(self):
+        """Drop every idle client"""
+        with self._lock:
+            self._idle.clear()
+
+    def get_stats(self):
+        """
+        Get pool statistics
+
+        Returns:
+            dict: Idle clients and creation, reuse and eviction counters
+        """
+        with self._lock:
+            return {
+                'idle': len(self._idle),
+                'max_size': self._max_size,
+                'created': self._created,
+                'reused': self._reused,
+                'evicted': self._evicted,
+            }
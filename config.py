@@ -14,10 +14,57 @@ BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN', 'your_bot_token_here')
 
 # Translation service configuration
 TRANSLATION_CONFIG = {
-    'rate_limit_delay': 0.5,  # Delay between translation requests in seconds
-    'max_text_length': 1000,  # Maximum text length for translation
+    # Backends in priority order: 'deep-translator', 'google-http', 'googletrans', 'argos' (offline).
+    # The first is primary; the second receives hedged requests when the primary is slow.
+    'translation_backends': [name.strip() for name in os.getenv('ECHOLANG_TRANSLATION_BACKENDS', 'deep-translator').split(',')],
+    'backend_options': {
+        'google-http': {'timeout': 5.0, 'pool_size': 10},  # Per-request timeout (s) and pooled keep-alive connections
+        # Idle Translators kept warm for reuse (googletrans before 4.0.2), and seconds before an unused one is dropped
+        'googletrans': {'client_pool_size': 4, 'client_idle_timeout': 300.0},
+        'argos': {
+            'workers': 2,  # Worker processes, each with its own copy of the loaded models
+            'threads_per_worker': 2,  # CPU threads per worker for inference
+            'package_dir': os.getenv('ARGOS_PACKAGES_DIR'),  # Installed model packages (argostranslate default if unset)
+            'auto_install': True,  # Download missing language pairs on first use
+            'preload_pairs': [],  # (source, target) pairs to load at startup, e.g. [('en', 'es')]
+        },
+    },
+    'hedge_default_delay': 1.5,  # Seconds before hedging until the primary has enough latency samples
+    'hedge_min_delay': 0.3,  # Never hedge sooner than this, even if the primary's p95 is lower
+    'breaker_failure_threshold': 5,  # Consecutive timeouts/rate limits that open a backend's circuit
+    'breaker_recovery_timeout': 30.0,  # Seconds a backend's circuit stays open before a probe request
+    'rate_limit_per_second': 2.0,  # Sustained translation requests per second
+    'rate_limit_burst': 4,  # Requests allowed back-to-back before the sustained rate applies
+    'max_concurrent_requests': 4,  # Translation requests in flight at once
+    'executor_max_workers': 4,  # Threads in the dedicated pool for blocking translation calls
+    'reaction_aggregation_window': 0.4,  # Seconds the first flag on a message waits for more flags to translate together
+    'reaction_deadline': 8.0,  # Seconds from a flag reaction to its posted translation, retries and waits included
+    'max_text_length': 4000,  # Maximum text length for translation (Discord's own message limit)
+    'chunk_max_length': 1000,  # Longer texts are split at line/sentence boundaries and translated in parallel
     'thread_auto_delete_delay': 120,  # Thread auto-delete delay in seconds (2 minutes)
     'thread_auto_archive_duration': 60,  # Thread auto-archive duration in minutes
+    'cache_max_entries': 2048,  # Translations kept in the in-memory LRU tier
+    'cache_ttl': 3600,  # Memory tier entry lifetime in seconds (1 hour)
+    'cache_disk_ttl': 7 * 24 * 3600,  # Disk tier entry lifetime in seconds (7 days)
+    'cache_db_path': os.getenv('ECHOLANG_CACHE_PATH', 'translation_cache.db'),  # SQLite file for the disk tier
+    'cache_write_delay': 1.0,  # Seconds new entries are collected before one batched commit to the disk tier
+    'near_duplicate_max_entries': 2048,  # Recent translations kept for lookup by their words, ignoring casing and punctuation
+    'batch_window_ms': 150,  # How long short texts wait to share a backend request (0 disables batching)
+    'batch_max_items': 16,  # Maximum texts packed into one batched request
+    'batch_max_chars': 4500,  # Maximum characters per batched request (backend limit is 5000)
+    'batch_max_text_length': 300,  # Only texts up to this length are batched
+    'detect_language_api_key': os.getenv('DETECT_LANGUAGE_API_KEY'),  # detectlanguage.com key for source detection
+    # Lowest local identification confidence trusted as the source language. The identifier only knows a
+    # closed set of languages, so anything outside it is still labelled as one of them with a low score;
+    # below this the text goes to the backend with source 'auto' and is never skipped as already translated.
+    'local_detection_min_confidence': 0.5,
+    # Speculative pre-translation (FEATURE_FLAGS['enable_speculative_translation'])
+    'speculative_languages': 3,  # Most languages each new message is pre-translated into
+    'speculative_min_reactions': 5,  # Recent flag reactions before a channel's messages are pre-translated
+    'speculative_min_share': 0.15,  # Smallest share of a channel's flag reactions a language needs
+    'speculative_budget_per_minute': 10,  # Most speculative backend requests per minute
+    'speculative_half_life': 6 * 3600,  # Seconds after which channel reaction statistics count half as much
+    'speculative_max_length': 500,  # Longer messages are not pre-translated
 }
 
 # Discord configuration
@@ -26,6 +73,9 @@ DISCORD_CONFIG = {
     'thread_name_template': 'Translations for message',
     'embed_color': 0x00ff00,  # Green color for translation embeds
     'error_color': 0xff0000,  # Red color for error embeds
+    'recent_message_cache_size': 5000,  # Recent messages remembered so flag reactions skip fetch_message
+    'user_name_cache_size': 10000,  # User names remembered so reactions are attributed without fetch_user
+    'reaction_dedupe_ttl': 5.0,  # Seconds a (message, emoji, user) reaction is remembered to drop redelivered events
 }
 
 # Logging configuration
@@ -44,6 +94,11 @@ FEATURE_FLAGS = {
     'enable_auto_thread_deletion': True,
     'enable_rate_limiting': True,
     'enable_text_length_limiting': True,
+    'enable_translation_cache': True,
+    'enable_hedged_requests': True,
+    'enable_segment_memory': True,
+    'enable_near_duplicate_lookup': True,
+    'enable_speculative_translation': False,  # Pre-translate new messages in busy channels (uses extra backend requests)
 }
 
 # Error messages
@@ -66,15 +121,33 @@ def validate_config():
     if not BOT_TOKEN or BOT_TOKEN == 'your_bot_token_here':
         issues.append("BOT_TOKEN not set or using placeholder value")
     
-    if TRANSLATION_CONFIG['rate_limit_delay'] < 0:
-        issues.append("Rate limit delay cannot be negative")
+    if TRANSLATION_CONFIG['rate_limit_per_second'] <= 0:
+        issues.append("Rate limit must be positive")
+    
+    if TRANSLATION_CONFIG['rate_limit_burst'] < 1:
+        issues.append("Rate limit burst must be at least 1")
+    
+    if TRANSLATION_CONFIG['max_concurrent_requests'] < 1:
+        issues.append("Max concurrent requests must be at least 1")
     
     if TRANSLATION_CONFIG['max_text_length'] <= 0:
         issues.append("Max text length must be positive")
     
+    if TRANSLATION_CONFIG['chunk_max_length'] <= 0:
+        issues.append("Chunk max length must be positive")
+    
+    if TRANSLATION_CONFIG['reaction_deadline'] <= 0:
+        issues.append("Reaction deadline must be positive")
+    
     if TRANSLATION_CONFIG['thread_auto_delete_delay'] <= 0:
         issues.append("Thread auto-delete delay must be positive")
     
+    if TRANSLATION_CONFIG['executor_max_workers'] < 1:
+        issues.append("Executor max workers must be at least 1")
+    
+    if TRANSLATION_CONFIG['cache_max_entries'] <= 0:
+        issues.append("Cache max entries must be positive")
+    
     if issues:
         logger.warning("Configuration issues found:")
         for issue in issues:
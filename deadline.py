@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+class Deadline:
+    """Absolute time budget for one request, passed down every layer that may wait"""
+
+    def __init__(self, budget):
+        """
+        Args:
+            budget (float): Seconds from now until the deadline
+        """
+        self._budget = budget
+        self._expires_at = time.monotonic() + budget
+
+    @property
+    def budget(self):
+        """Seconds the deadline allowed in total"""
+        return self._budget
+
+    @property
+    def remaining(self):
+        """Seconds left before the deadline, never negative"""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        """Whether the deadline has passed"""
+        return time.monotonic() >= self._expires_at
+
+    def cap(self, timeout):
+        """
+        Limit a timeout to the time left
+
+        Args:
+            timeout (float): Timeout in seconds, or None for no timeout of its own
+
+        Returns:
+            float: The smaller of the timeout and the remaining time
+        """
+        if timeout is None:
+            return self.remaining
+        return min(timeout, self.remaining)
+
+    async def wait_for(self, awaitable):
+        """
+        Await something, giving up when the deadline passes
+
+        Raises:
+            asyncio.TimeoutError: The deadline passed first
+        """
+        return await asyncio.wait_for(awaitable, timeout=self.remaining)
+
+    @staticmethod
+    def later(first, second):
+        """Pick whichever of two deadlines (either may be None) leaves more time"""
+        if first is None or second is None:
+            return first or second
+        return first if first._expires_at >= second._expires_at else second
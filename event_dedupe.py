@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+
+class EventDeduplicator:
+    """Short-lived set of event keys, so an event delivered twice is only handled once"""
+
+    def __init__(self, ttl=5.0, max_entries=10000):
+        """
+        Args:
+            ttl (float): Seconds a key is remembered
+            max_entries (int): Keys remembered at most; the oldest is forgotten first
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._seen = OrderedDict()  # key -> time first seen, oldest first
+        self._duplicates = 0
+
+    def seen(self, key):
+        """
+        Check whether a key was already seen within the TTL, remembering it if not
+
+        Args:
+            key (tuple): Event idempotency key
+
+        Returns:
+            bool: True if the event is a duplicate and should be dropped
+        """
+        now = time.monotonic()
+        cutoff = now - self._ttl
+        while self._seen:
+            oldest_key, first_seen = next(iter(self._seen.items()))
+            if first_seen > cutoff:
+                break
+            del self._seen[oldest_key]
+
+        if key in self._seen:
+            self._duplicates += 1
+            return True
+
+        self._seen[key] = now
+        if len(self._seen) > self._max_entries:
+            self._seen.popitem(last=False)
+        return False
+
+    def forget(self, key):
+        """
+        Forget a key, so the next event with it is handled again
+
+        Args:
+            key (tuple): Event idempotency key
+        """
+        self._seen.pop(key, None)
+
+    def get_stats(self):
+        """
+        Get deduplication statistics
+
+        Returns:
+            dict: Remembered keys and duplicates dropped
+        """
+        return {
+            'tracked': len(self._seen),
+            'duplicates': self._duplicates,
+        }
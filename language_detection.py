@@ -0,0 +1,493 @@
+import bisect
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Unicode blocks as (first code point, last code point, script), sorted by first code point
+SCRIPT_RANGES = [
+    (0x0041, 0x024F, 'latin'),
+    (0x0370, 0x03FF, 'greek'),
+    (0x0400, 0x052F, 'cyrillic'),
+    (0x0530, 0x058F, 'armenian'),
+    (0x0590, 0x05FF, 'hebrew'),
+    (0x0600, 0x06FF, 'arabic'),
+    (0x0750, 0x077F, 'arabic'),
+    (0x0900, 0x097F, 'devanagari'),
+    (0x0980, 0x09FF, 'bengali'),
+    (0x0A00, 0x0A7F, 'gurmukhi'),
+    (0x0A80, 0x0AFF, 'gujarati'),
+    (0x0B80, 0x0BFF, 'tamil'),
+    (0x0C00, 0x0C7F, 'telugu'),
+    (0x0C80, 0x0CFF, 'kannada'),
+    (0x0D00, 0x0D7F, 'malayalam'),
+    (0x0D80, 0x0DFF, 'sinhala'),
+    (0x0E00, 0x0E7F, 'thai'),
+    (0x0E80, 0x0EFF, 'lao'),
+    (0x1000, 0x109F, 'myanmar'),
+    (0x10A0, 0x10FF, 'georgian'),
+    (0x1100, 0x11FF, 'hangul'),
+    (0x1200, 0x139F, 'ethiopic'),
+    (0x1780, 0x17FF, 'khmer'),
+    (0x1E00, 0x1EFF, 'latin'),
+    (0x3040, 0x30FF, 'kana'),
+    (0x3130, 0x318F, 'hangul'),
+    (0x3400, 0x4DBF, 'han'),
+    (0x4E00, 0x9FFF, 'han'),
+    (0xAC00, 0xD7AF, 'hangul'),
+    (0xF900, 0xFAFF, 'han'),
+    (0xFF66, 0xFF9F, 'kana'),
+]
+_RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
+
+# Scripts written by (practically) one language
+SCRIPT_LANGUAGES = {
+    'greek': 'el',
+    'armenian': 'hy',
+    'hebrew': 'he',
+    'devanagari': 'hi',
+    'bengali': 'bn',
+    'gurmukhi': 'pa',
+    'gujarati': 'gu',
+    'tamil': 'ta',
+    'telugu': 'te',
+    'kannada': 'kn',
+    'malayalam': 'ml',
+    'sinhala': 'si',
+    'thai': 'th',
+    'lao': 'lo',
+    'myanmar': 'my',
+    'georgian': 'ka',
+    'hangul': 'ko',
+    'ethiopic': 'am',
+    'khmer': 'km',
+    'kana': 'ja',
+}
+
+# Letters that single out one language among those sharing a script; the
+# first language whose letters appear wins, otherwise the script's default
+# is only a guess
+SCRIPT_LETTER_HINTS = {
+    'cyrillic': ([
+        ('uk', 'їєґі'),
+        ('be', 'ў'),
+        ('kk', 'әғқңөұүһ'),
+        ('sr', 'ђћџ'),
+        ('mk', 'ѓќѕ'),
+        ('bg', 'ъщ'),
+    ], 'ru'),
+    'arabic': ([
+        ('ur', 'ٹڈڑںےھ'),
+        ('fa', 'پچژگ'),
+    ], 'ar'),
+    # Kanji-only Japanese (names, short phrases) is indistinguishable from Chinese,
+    # except that simplified-only characters never appear in Japanese
+    'han': ([
+        ('zh', '们这说时对为过么还发样经见让话给爱东车马长门问间'),
+    ], 'zh'),
+}
+
+# Letters worth a bonus for the Latin-script languages that use them
+LATIN_LETTER_HINTS = {
+    'es': 'ñ¿¡',
+    'de': 'ßü',
+    'fr': 'èêëçœ',
+    'pt': 'ãõç',
+    'it': 'ì',
+    'pl': 'łąęśźżń',
+    'cs': 'řůěčšž',
+    'hu': 'őű',
+    'ro': 'ășțâî',
+    'tr': 'ğışç',
+    'sv': 'äöå',
+    'fi': 'äö',
+    'da': 'æøå',
+    'no': 'æøå',
+    'vi': 'ăâđêôơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ',
+}
+
+# Most frequent character trigrams per Latin-script language, highest ranked first,
+# precomputed from everyday chat text; words are padded with a space on each side
+TRIGRAM_PROFILES = {
+    'en': (
+        ' th|the|he | an| to|and|nd |at |ing|re | yo|you|her|ng |ou | i |in | be|tha|er | wi|ne |'
+        ' ar|are| do|oul|uld|ld |is | of|of |to |hat| wa|as |wit|ith|th |en | in| mo|mor|orn|nin|'
+        'one|ow | we| is|ll |was| re|rea|eat|igh|ght| co|oth| ha|ty | li|ood|od |rni| ev|eve|ver|'
+        'ery|ryo|yon|thi|nk |we | sh|sho|hou| me|mee|eet|et |se |ere| st|ill| a | wo|do |han| mu|'
+        ' he|all|ly | ni|ce |ht |rde|ers| pl|ard| fr|ien|end|ds |eas|ber|hav|ave|ve | se|een|it |'
+        'an |ed |ity| ri|rig|son|on |rit|me | go|goo| ho|how|doi|oin|tod|oda|day|ay |hin|ink| ag|'
+        'aga|gai|ain|tom|omo|orr|rro|row|bec|eca|cau|aus|use|sti|til| lo|lot|ot |wor|ork|rk |ank|'
+        ' so|so |muc|uch|ch | fo|for|or |our|ur |hel|elp|lp |eal|lly|nic|ice| wh|wha|wan|ant|nt |'
+        " ea|ton|oni|nig|don|on'|n't|'t | kn|kno|now| ye|yet| ma|may|ayb|ybe|be |cou| or|ord|der|"
+        ' pi|piz'
+    ),
+    'es': (
+        'os | de| la|la | es| qu| co|ue | lo| y |est|que|as | a | to|tod| po|por|or |de |es |con|'
+        'los|nos|stá|na |da |ere|on |rec|en |odo|dos|ría| re|ra |ía | mu|cho|er |res|com| pe|era|'
+        'ida|ad |mo |oy |deb|ebe|ber|íam|amo|mos|reu|eun|uni| ot|otr|tra| ve|vez|ez | ma|mañ|aña|'
+        'ñan|ana|oda|dav|aví|vía|muc|uch|ho |rab|aba| ha|ace|has|cia| tu|tu | fu|fue| am|te |qui|'
+        'mer|sta| no|lo |ás | un| el|el | ti|tie|emp|mpo| pr|tán|án |do | en| su|ami| fa|ón | nu|'
+        'nue|uev| vi|sto| me|per| se| li|lib|dad|der|ech|tad|nci|ien|ia |rta|tar|vid| bu|bue|uen|'
+        'eno| dí|día|ías| có|cóm|ómo|tái|áis|is | ho|hoy| cr|cre|reo|eo |erí|nir|irn|rno|orq|rqu|'
+        'ued|eda| tr|baj|ajo|jo |hac|cer|cha| gr|gra|rac|aci|ias| ay|ayu|yud|uda|muy|uy |ama|mab|'
+        'abl|ble|le | pa|par|art|rte|qué|ué |uie|ier|ome|ta |noc|och|che|he |no | sé|sé |uiz|izá|'
+        'zás|pod'
+    ),
+    'fr': (
+        ' qu|es |que|ue | de| le| et|et |de | à |ous|us |ent|nt |ns |ce |res| en|it |is | la|la |'
+        're |ais|les|our| to| co| no|nou|ir | pa|il |est|enc|eau|ait| ce|tre|le |té |jou|tou|com|'
+        "omm|men| au| je|je | pe|ion|ons| re|in | be|bea| fa|on | c'|éta|tai|rai|st |ux | ma|ne |"
+        "as | un| av|ave|vec|ec |son|ur |mme|lle|rio|rev|oir|mai|ain|par|qu'|nco|cor|ore|auc|uco|"
+        "cou|oup|up | tr|fai|mer|ci | po|pou|c'é|'ét|aim|ime|'es| tu|tu |eux|man|er | so| ne| sa|"
+        "pas|ut | êt|êtr|aut|utr| il|au |ts | da|dan|ans|eur|rs |ami|ie |nce|era|du | es| j'|j'a|"
+        ' li|lib|en |nit|ité| dr|dro|roi|oit| do|ven|ers| bo|bon|onj|njo| al|all|lez|ez | vo|vou|'
+        "auj|ujo|urd|rd'|d'h|'hu|hui|ui |pen|ens|nse|se |dev|evr|vri|evo|voi|dem|ema|arc|rce|u'i|"
+        "'il|ste|te |tra|rav|ava|vai|ail|air|ire| me|erc|rci|ton| ai|aid|ide| vr|vra| ge|gen|nti|"
+        'til| ta'
+    ),
+    'de': (
+        'en |ch |ich|nd |er | un| da|und|it |der| de|das|ie |te |as |cht| be|ten| wi| ge| ic|den|'
+        'ein|st |ht | es|iel|eit|len| wa|war| di|lle| mi|mit|nde| si|ute| mo|mor|org|rge|gen|men|'
+        'es |wir|ir | no|noc|och| ei| we| vi|vie|ine|ar | ne|hte|sse|ren|bes|tte|ist|die|ind| fr|'
+        'fre|art|rec|ech|beg| ha| er| zu|mme|wie| he|heu|eut|enk| so|sol|oll|ns |mal|al |wei|un |'
+        'bt |ele|nk |ne | hi|lic|ett|on | mö|möc|öch|est| du|du |ben|ess|sen|ell|lei|eic|nnt| an|'
+        'and|ste| is|sch|eun| im|im |rte| bi|an |ass|ss |neu|ens|hen| al|hat| me|che|sin|rei| re|'
+        'ede|hei|ers| gu|gut|zus|usa|sam|amm|geh|eht| eu|euc|uch|nke|ke |llt|lte|uns|inm|nma| tr|'
+        'tre|ref|eff|ffe|fen|eil|il |el | ar|arb|rbe|bei|zu | tu|tun| gi|gib|ibt|dan|ank| fü|für|'
+        'ür |dei|hil|ilf|lfe|fe |irk|rkl|kli|net|tt | vo|von|dir|was|tes| ab|abe|end|eiß|iß | ni|'
+        'nic| kö'
+    ),
+    'it': (
+        'no | di|la |to | co| in|re |gli| al| e | pe|con|di |ni |ra | la|li |lla| tu|tti|ti | st|'
+        'sta|per| fa|are| mi|on |za | gl|ri |all|ono|gio|tat|so | ch|che|he | do|mo |nco|man|cor|'
+        'ro | da|da |le | il|il | è |tas|era| so|ell|ssi|in | de|iri|rit|son|ia |ngi|orn|tut|utt|'
+        'ate|te | og|rem|emm|mmo|ci | nu|nuo|uov|ovo|vo |ani| an|anc|ora|olt|avo|vor|oro|zie|lle|'
+        'er |uo |ver|cos| ma|gia|iar|ser| no| lo|ord|rdi|din|nar| un|na | pi|zza|alt|ltr|tri| i |'
+        'ini| gi|ino|ami| ri|uni|ion|one|ne |del| ha| vi| er| qu|ant|mi |si |sic|ica|ca | es|ess|'
+        'eri| li|lib|ibe|ber| ed|ed |gni|tà |dir|itt|agi|nza|ers|rso|ta | pr|pri| bu|buo|uon|ong|'
+        'ior|rno| a |com|ome|me |ogg|ggi|gi |pen|ens|nso|dov|ovr|vre|inc|ont|ntr|tra|rar|arc|rci|'
+        "dom|oma|erc|rch|ché|hé | c'|c'è|'è | mo|mol|lto|lav|far| gr|gra|raz|azi|ie |mil|ill|tuo|"
+        ' ai|aiu'
+    ),
+    'pt': (
+        'os |de | co| de|com|que| e | es|ão | qu|ue | no|da |ito|em |om | a |to |do | se| di|ia |'
+        ' vo|est|ind|ra | à | os| to|tod|odo|dos|voc|ocê| ho|ar |nov|man| mu|mui|uit| pa|par| fa|'
+        'er | pe| o |dir| li|as |or | em|ida|dad|ade|stã|tão|hoj|oje|je |ho |dev|eve|mos|nos|con|'
+        'tra|ovo|vo | am|anh|nhã|hã | po|por| ai|ain|nda|lho|ara|bri|ado| su|sua|ua | fo|foi|oi |'
+        ' da|te |cê |ome| nã|não|vez|ez |ir |uma|ma | ou|out|utr|tro|ros| te|tem|ndo|ria|anç|nça|'
+        'gos|hor| vi| do|esp|era|res|es |nid|ire|rei|eit| é |tar| bo|bom|dia|omo|mo |cês|ês | ac|'
+        'ach|cho|ver|erí|ría|íam|amo| en|enc|nco|ont|ntr|rar|ama|orq|rqu| há|há | tr|rab|aba|bal|'
+        'alh|faz|aze|zer| ob|obr|rig|iga|gad|pel|ela|la | aj|aju|jud|uda| ge|gen|ent|nti|til|il |'
+        'art|rte|uer|mer|noi|oit|ite|sei|ei | ta|tal|alv|lve| pu|pud|udé|dés|éss|sse|sem|emo|ped|'
+        'edi| um'
+    ),
+    'nl': (
+        'en |et | de|er | en|at | he| be|de | ge| me|cht|der|gen| va|van|met| ik|ik | da|dat| we|'
+        ' ee|ten| ve| je| wa|het|and|een|eer|ete|je |an |nde|ren|in |ver| zi|ers|ede|rge|lle|den|'
+        'we | no|nog|og | te|te | is|is |erg|was|as |ech|ht |aar|dig|ig | ni|nie|sch|ien| vr|vri|'
+        'end| in|ij |hei|eid|id |zij|ijn|jn |oed|mor|org| al|all|aag|ag |lie|ie | mo| ke|kee| om|'
+        ' er|eel|el |hee|dan| hu|ard|rdi|nd |wee|eet|iet| mi|hie|ere|est|ste|len|ach|tig|gee|ege|'
+        'hte|beg|egi|zie| hi|ter|gew|ewe|men|ens|rij| re|rec|ore|rst| go|goe|dem|emo|lem|ema|maa|'
+        'aal|al | ho|hoe|oe | ga|gaa|aat|nda|daa| ju|jul|ull|lli|enk|nk |moe|oet| af|afs|fsp|spr|'
+        'pre|rek|eke|ken|omd|mda|vee|wer|erk|rk | do|doe|oen|rg |bed|eda|ank|nkt|kt | vo|voo|oor|'
+        'or |hul|ulp|lp | ec| aa|wat| wi|wil|il |ana|nav|avo|von|ond| et|mis|iss|ssc|chi| ku|kun|'
+        'unn|nne'
+    ),
+    'sv': (
+        'en |et | oc|och|ch |de | de| va|ar |ag |är | ja|jag|tt | i |and| fö|var| är|cke|ker|er |'
+        ' vi|gen|för| me|med|ed | ha| mo|mor|org|rgo|gon|yck| at|att|rde|ers|det|ete|te |ra |äll|'
+        'ig |ill|ll |kan|la | en| vä|den|ätt|het|on | al|all| ni|vi | tr|trä|ige|ter|rso|om |ara|'
+        'ran| fi| my|myc|ket|ack|ör | di|in | ve|lig| av|av |vil| du|du |ta |vet|nte| än|än | ka|'
+        'an |lla| an|ndr|dra|nen|vän|änn| ko|kom| bö|bör|har|ade|nta| mi| fa|isk|da | fr|fri| li|'
+        'ka | rä|rät|sta| ti|til|ilj| go|god|od |lli|lih|iho|hop|opa|pa | hu|hur|ur | må|mår|år |'
+        'ni | id|ida|dag| ty|tyc| bo|bor|ord|räf|äff|ffa|fas|as | ig| ef|eft|fte|som| fo|for|ort|'
+        'rtf|tfa|far|nde|fin|inn|nns|ns | ar|arb|rbe|bet| gö|gör|öra| ta|tac|ck | så|så |din| hj|'
+        'hjä|jäl|älp|lp |ver|erk|rkl|kli| sn|snä|näl|llt|lt |dig|vad|ad | ät|äta| kv|kvä|väl| in|'
+        'int|ans'
+    ),
+    'da': (
+        'en |er | de|et |ed | og|og | ha| i |ar | er| me|det| je|jeg|eg | vi|der|de |lig| en|hed|'
+        'gen|lle| at|at |le | fo|for|ig |re | ve|kke|med|ret|ven|mor|org|rge|sam|mme|men| hv|har|'
+        'es | mo|dig|ge | va|var|il |hav|ikk|nne|ne | be|til|and|dre|igh|ghe| al|all|amm|ord|nes|'
+        'vi | mø|mød|øde|ige|rdi|ege|ang| di|in |ødt|dt | af|vil| du|du |ave|ke |end|ske|sti| sa|'
+        'ndr| bø|bør|rne|nen|ene|ger|enn|sk |nli|ken|den|nd |sik| fa|ker| fø| fr|fri|ie | li| re|'
+        'tti|tig|hve|ver|ers| ti| go|god|odm|dmo|les|esa|hvo|vor|rda|dan|an | da|dag|ag | sy|syn|'
+        'yne| sk|sku|kul|ull|des| ig|di | st|sta|tad|adi|meg|get| ar|arb|rbe|bej|ejd|jde| gø|gør|'
+        'øre| ma|man|nge| ta|tak|ak |or |din| hj|hjæ|jæl|ælp|lp |vir|irk|rke|kel|eli| sø|sød|af |'
+        'hva|vad|ad |ve | sp|spi|pis|ise|se |aft|fte|ten|ved| ik|ndn|dnu|nu | må|mås|åsk| ku|kun|'
+        'unn|bes'
+    ),
+    'no': (
+        'en |er |et | de| me| og|og |men| ha|ar |eg | er|enn|nne|re | i | je|jeg| fo|for|med|ed |'
+        ' mo|gen|le | sa|sam|mme|det|nes| vi|de | en|ne |ker|het|mor|org|rge|lle|amm| hv|har|tt |'
+        ' va|var| ve|ig |il |ikk|kke| be|til|and|dre|ret|ett|esk|ske|ver| al|all|ord|ere|es |vi |'
+        ' mø|møt|øte|gje|ye | gj|vel|eld|vil| du|du |ke |sti|ndr| ny|lig|ven|nen|ene| si|sk |tet|'
+        'den|sik| fa| fø| fr|fri|me |tti|tig|igh|ghe|hve| ti| go|god|od |hvo|vor|rda|dan|an |der|'
+        ' da|dag|ag | sy|syn|yne| bu|bur|urd|rde|tes| ig|igj|jen|rdi|di |ort|rts|tsa|sat|att| my|'
+        'mye| ar|arb|rbe|bei|eid|id | å |gjø|jør|øre| tu|tus|use|sen| ta|tak|akk|kk |or | hj|hje|'
+        'jel|elp|lpe|pen|ldi|dig| sn|sni|nil|ilt|lt | av|av |deg|hva|va | sp|spi|pis|ise|se | kv|'
+        'kve|ld |vet| ik|nnå|nå | ka|kan|ans|nsk|skj|kje|je | ku|kun|unn|bes|est|ill| pi|piz|izz|'
+        'zza|za '
+    ),
+    'fi': (
+        'en |on | ja|ja |ta | ka|isi| on|an |tä |än |een| ol|ais|kai|lle| tä|ell|na |lla|la |sin|'
+        'lta|ssa|sa |in |aan| he|ill|le | mi|mit|itä| ku|änä|sta| ta| ko|vie|elä|lä | pa|täv|oli|'
+        'li | to|stä| mu|den|kan|ans|nss|ikk|kki|ki |ise|taa|yvä|ää | hu|huo|uom|ome|men|aik|kil|'
+        ' te|eil|tän|ään|inu|ust|eid|idä|dän| pi|si |tav|ava|ata| uu|uud|ude|del| vi|iel|pal|alj|'
+        'ljo|jon|ävä|nä |tas| se|se | ys|yst|äll|lli|lis|ist| ha|hal|alu|lua| sy|dä |ilt| en| ti|'
+        'ois|sim|imm|mui|set|et |vät|ät |uut|ens|sä |ett|us |aa | ke|ull|ole| el| va|vap|apa|ina|'
+        'ert|rta|tai| oi|oik|ike|keu|hei|toi|koh|oht|hta|hen|ämä|ute|tee| tu| hy|hyv|vää|ent|nta|'
+        'iki|tei|kuu|uul|ulu|luu|uu |nää|min|nus| me|mei|pit|täi|äis|vat|lee|enn|nna|kos|osk|ska|'
+        'ka | ty|työ|yöt|ötä|teh|eht|htä|vän| ki|kii|iit|ito|tos|os | av|avu|vus|asi|tod|ode|väl|'
+        ' si|nul'
+    ),
+    'pl': (
+        'dzi| po| dz|zie| si|się|ię |ie | je|jes|em | i |nie| pr|ni |szy|inn|est|pra|ej |odz| sw|'
+        ' do|wsz|aj |że |pow|owi| sp|spo|esz|cze|ze | ra|iew|st |eni| za| by|był|raw| z |na |wie|'
+        ' mo| pi|mi |ci |rod|zy | ro| wo| ws|zys|zis|isi|sia|iaj| ma|aci| że|win|nni|śmy|my |pot|'
+        'otk|tka|ać |szc|zcz|raz|az |tro|oni|ewa| du|cy |do |ien|ia | ba|ięk|ję | to|to | na| ch|'
+        'chc| ni| wi|iem|ić |zę | in|nny|god| a |iec|wią| w | cz|iał|ałe|pod|wol|oln|swe|wej|noś|'
+        'ośc|ści|ych|ch |stw|twa|wa |dy |cia|pie|ień|eń |dob|obr|bry|ry |yst|stk|tki|kim|im | ja|'
+        'jak|ak |mac|cie| my|myś|yśl|ślę|lę |niś|iśm|kać| ju|jut|utr|ro |pon|waż|aż | wc|wci|cią|'
+        'iąż|ąż |duż|użo|żo |rac|acy| zr|zro|rob|obi|bie|nia|bar|ard|rdz|dzo|zo |zię|ęku|kuj|uję|'
+        'za |pom|omo|moc|oc |yło|ło |nap|apr|awd|wdę|dę | mi|mił|iłe|łe | tw|two|woj|oje|jej| st|'
+        'str|ron'
+    ),
+    'cs': (
+        ' se| a |se | by|em | pr| je| sv|ím | po| js| ro| rá|že |byc|ych|je |prá| mo| za|byl| co|'
+        'co | ne|si |ost| na|sem|svo|ní |ou | do|rán|áno|no | vš| dn|dne|nes|es | má| že|cho|hom|'
+        'om |li |nov|pro|ád | ho|hod|odn|moc|oc | dě|ji |pom| to|to | te|opr|du |st | si| os|mi |'
+        'jed|edn|dna|nat|at |ti |hra|ají|jí |na | ka|rád|dy | v |odi|din|jse|ni |rod|vob|obo|bod|'
+        'sob|nos|ráv|dob|obr|bré|ré |vše|šem| ja|jak|ak |mát|áte|te | my|mys|ysl|slí|lím| mě|měl|'
+        'ěli| zí|zít|ítr|tra|ra | zn|zno|ovu|vu |sej|ejí|jít|ít |rot|oto|tož|ože|poř|ořá|řád|dně|'
+        'ně |rác|áce|ce |děk|ěku|kuj|uji|za | tv|tvo|voj|oji|omo|ylo|lo | od|od |teb|ebe|be | op|'
+        'pra|rav|avd|vdu| mi|mil|ilé|lé | ch|chc|hce|ceš|eš | ve|več|eče|čer|er | jí|jís|íst|ješ|'
+        'ešt|ště|tě |nev|eví|vím|mož|ožn|žná|ná |moh|ohl|hli| s |sta|tat|atn|tní|ním|ími| ob|obj|'
+        'bje| pi'
+    ),
+    'hu': (
+        ' sz| a |sze| és|és |ek | mi| ho|gy | va| ke|ere|el | az|az |en |lt |min|nde|hog|ogy|agy|'
+        'zer|sza|emb|mbe| re|ind|den|nek|ok |alá|kel|ell|ene|ne | mé|van|an |án | vo|vol|olt|ret|'
+        'etn|tné| eg|egy|ben|al | jo|mél|ság|ga |zem|reg|egg|gge|gel|elt|vag| ma|ma |eri|int|em |'
+        ' új|ra | ta|tal|unk|nk |lle|len| me|mer|ert|még|ég | na|nag|gyo|on |et |nni|ni |est| ne|'
+        'dom|om | gy|rű |gye|rek|kal| el|ik |tta| em|ber|ri |zab|aba|bad|let|jog|oga|ssz|zel|sal|'
+        'tes| vi|vis|emé|ély|ez |ágh|gho|hoz|oz | jó|jó |enk|nki|kin|ine|gyt|yto|tok|rin|nte|tem|'
+        'hol|oln|lna|nap|ap |újr|jra|lál|álk|lko|koz|ozn|znu|nun|rt | so|sok| mu|mun|nka|ka | há|'
+        'hát|átr|tra|yon| kö|kös|ösz|szö|zön|önö|nöm|öm | se|seg|egí|gít|íts|tsé|ség|ége|ged|ede|'
+        'det| ig|iga|gaz|azá|zán|ked|edv|dve|ves|es | tő|től|őle|led|ed |mit|it |nél|él | en|enn|'
+        ' es|ste'
+    ),
+    'ro': (
+        'te | în| și|și |ate|că |să |ea |le | să| fo|în | se| di|min| ce|ai |ne |din|est| mu|mul|'
+        ' de|rte| co| cu|cu |ii |inț| la|la |ele|ță |nă |ine|ța |or |ce | ma|mai| fa| că| no|nou|'
+        ' pe|ru | es|ste|înc|art| a |fos|ost|st | dr|tea| vr|vre| mă|man|se | fi|ul |ept|iin|tat|'
+        ' bu|bun|dim|imi|nea|eaț|ața|tur|ți | as|ast| ar| tr|tre|reb|ebu|bui|înt|in |ou |pen|ent|'
+        'ntr|tru|ncă|ult|lt |de | vă|sc |foa|oar|tor|ta |ei |ci |ra |ști|oat|am |com|mea| fr| pr|'
+        'pri|ții| mi| or| ai|mă | aș|ată|tă |fii| um|uma|ane| li|lib|ibe|ber|re |ale|nit|ita|dre|'
+        'rep|ptu|uri| su|sun|unt|nt |rat|une|nță|ață|rit|tul|ună| tu|tut|utu|uro|ror|fac|ace|ceț|'
+        'eți|stă|tăz|ăzi|zi | cr|cre|red|ed |ar |ui | ne|ntâ|tâl|âln|lni|nim|im | mâ|mâi|âin| lu|'
+        'luc|ucr|cru|vă |ulț|lțu|țum|ume|mes|esc| aj|aju|jut|uto|dră|răg|ăgu|guț|uț | pa|par| ta|'
+        'rei|măn'
+    ),
+    'tr': (
+        'ar | ve|ve | ha|lar| ço|yor|ler|irl|ın | bu| ya|çok|ok |eri|iyo| bi|rle|bir|iye|yet| he|'
+        'ün |ını| be| te|in |ede| ge|kte|en |ikt|oru|rum|um |le |lik| ba| sa|et |er |her| gü|gün|'
+        'ayd|ydı| na|ız |yar|arı|tek|ekr|kra|rar|aca|ak |iş |ard|ımı|mın|ür | ed|zik| ak|şam|ne |'
+        ' ye|mek|ek | is|ist|sti|tiy|bil|ilm|lmi|diğ|riy|rli|te |ari|kla|bah|aşl|şla|rla| do|aya|'
+        ' mü|kle|har| hü|hür|hak|akı|dan| ka|kar|niy|eti|ti | il|ile|eli|gel|erk|rke|kes|ese|se |'
+        'üna|nay|dın|bug|ugü|nas|ası|sıl|ıls|lsı|sın|nız|ben|enc|nce|ce |rın|bul|ulu|luş|uşm|şma|'
+        'mal|alı|lıy|ıyı|yız| çü|çün|ünk|nkü|kü | hâ|hâl|âlâ|lâ |yap|apı|pıl|ıla|lac|cak| iş| va|'
+        'var|rdı|dım| iç|içi|çin|teş|eşe|şek|ekk|kkü|kür|der|rim|im |ger|erç|rçe|çek|ekt|ten|naz|'
+        'azi|kti|tin|bu |akş|kşa|am | ne|yem|eme|ors|rsu|sun|un |hen|enü|nüz|üz |miy|bel|elk|lki|'
+        'ki | di'
+    ),
+    'id': (
+        'an |ya | be| da| se| sa|ang|ng |dan|nya| ka|ama| ha| in| ba|ak |say|aya|ber| di|ma | ke|'
+        'at |ni |mu | ma| ya|yan|kan|in | me|lam|sem|any|apa|ar |kal|ali|har|ini|aru| pe|eka|aka|'
+        'sam|ai |agi|gi |emu| ap|us |tem| la|ena|ih |ban|ila| te|ata|kam|amu|am |ers|rsa|lai|ain|'
+        'ah |nga|ema|man|mer|ka |ran|hak|sel|ela|mat| pa|pag|mua|uan|pa |aba|bar|ari|ri | pi| ki|'
+        'kit|ita|ta |rus|ert|kar|asi|sih|yak|aan|dil| at|tas|as |ben|nar|li |ala|elu| mu| bi|sa |'
+        'san|ind|nda|dah| an|ana|nak|di |keb|ere|rek|ing|gat|rap| ak|emb|uda| fi|fil|ilm|lm |tu |'
+        'bag|dar|ara|kny|lua|uar|asa| or|ora|rta|rga|per|idu|eba|kab|lia|ian|pik|iki|kir|ir |rte|'
+        'lag|bes|eso|sok|ok |are|ren|na |mas|pek|eke|ker|erj|rja|jaa|lak|aku|kuk|uka|ter|eri|rim|'
+        'ima|kas|ant|ntu|tua|anm|nmu|bai|aik|ik |sek|mau|au |mak|mal|bel|lum|um | ta|tah|ahu|hu |'
+        'mun|ung'
+    ),
+    'vi': (
+        'ng | ch| nh| và|và | ng|ời | bạ|bạn|ạn |ất |nh | tô|tôi|ôi | rấ|rất|ọi |ngư|gườ|ười|ay |'
+        ' th|ều | ph|ới | tr|ình|ào | mọ|mọi|chú|hún|úng| gi| vớ|với|ong| sá|sán|áng| na|nay|ác |'
+        ' ta|ta |ên | lạ|lại|ại |nha|hau|au | vì|vì | vẫ|vẫn|ẫn |nhi|hiề|iều|phả|hải|ải | là| cả|'
+        'ơn | đã|đã | tố|ối | mu|muố|uốn|ốn |chư|hưa|ưa |iết|ết | có|có | cù|cùn|ùng| ti|tro|ron|'
+        ' củ|của|ủa | đầ|đầu|ầu |em |âm | đề|đều| đư|đượ|ược|ợc | qu|ần | đâ|đây|ây |chà|hào| bu|'
+        'buổ|uổi|ổi | hô|hôm|ôm | cá|các|thế|hế | nà|nào|ngh|ghĩ|hĩ | nê|nên| gặ|gặp|ặp |vào|ngà|'
+        'gày|ày | ma|mai|ai | cò|còn|òn | vi|việ|iệc|ệc |làm|àm |cảm|ảm | ơn|giú|iúp|úp | đỡ|đỡ |'
+        'thậ|hật|ật | sự|sự |tốt|ốt | bụ|bụn|ụng|tối| ăn|ăn | gì|gì | bi|biế| lẽ|lẽ |thể|hể | gọ|'
+        'gọi| pi|piz|izz|zza|za |nhữ|hữn|ững| kh|khá|hác|thờ|hời|tiế| đẹ|đẹp|ẹp | bọ|bọn|ọn |trẻ|'
+        'rẻ | đa'
+    ),
+    'tl': (
+        'ng |ang|at | ka| an| ma| na|ong|sa |an |mag|aga| sa| pa|ala|gan| ng|apa| at|and| ta|nda|'
+        'ga |yon|ayo|ara|tay|na |ama| mo|to |in | ko|ko |pat|kas|ila|lan|mo |aka| ba|asa|pan|ay |'
+        ' um|uma|aha|ust|ta |nga|ing| da|agk| bu|as |ami|kai|nap|pak|aya|sam|ma |da | mg|mga|la |'
+        'nan|ito| is|ran| in| la|lah|hat|mus|kay|gay|dap|it |mar|ram|pa |aba|aho| ga|lam|ulo|lon|'
+        'lag|ano| gu|gus|sto|ini|yan|ndi| al|ka | pu|uwe| pi|ba |nag|ata|nil|aki|tan|isi|ula|lik|'
+        ' it|ina| ay|mal|ya |ant|nta|kar|gka|ira|isa| ak|dan|iny|nyo| ku|kum|umu|sta|yo | ar|raw|'
+        'aw | ti|tin|ngi|gin|gki|kit|ita| ul|uli|lit|buk|uka|dah|ahi|hil|il |mi | tr|tra|rab|bah|'
+        'ho |ail|gaw|awi|win|min|sal|mat| tu|tul|tal|kab|bai|ait|no |mon|ain|nin|mam|may|gab|abi|'
+        'bi | hi|hin|ind|di |am |bak|puw|wed|ede|de |umo|mor|ord|rde|der|er |piz|izz|zza|za | ib|'
+        'iba|ana'
+    ),
+}
+
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+# URLs and Discord mentions, channels and custom emoji say nothing about the language
+_NOISE = re.compile(r"https?://\S+|<a?:\w+:\d+>|<[@#][!&]?\d+>")
+
+def _index_profiles(profiles):
+    """Invert ranked trigram strings into trigram -> ((language, weight), ...), highest rank weighing most"""
+    index = {}
+    for language, ranked in profiles.items():
+        trigrams = ranked.split('|')
+        size = len(trigrams)
+        for rank, trigram in enumerate(trigrams):
+            index.setdefault(trigram, []).append((language, (size - rank) / size))
+    return {trigram: tuple(entries) for trigram, entries in index.items()}
+
+_TRIGRAM_INDEX = _index_profiles(TRIGRAM_PROFILES)
+
+class LanguageIdentifier:
+    """Fast in-process language identification from Unicode scripts and character trigram profiles"""
+
+    # Bonus per hint letter, relative to an average trigram score
+    LETTER_HINT_WEIGHT = 0.5
+    # Average lead per trigram of the best Latin-script profile over the runner-up that counts as certain
+    FULL_CONFIDENCE_LEAD = 0.2
+    # Confidence of a script's default language when no letter singles one out
+    SCRIPT_DEFAULT_CONFIDENCE = 0.4
+
+    def __init__(self, min_confidence=0.5, min_letters=8):
+        """
+        Args:
+            min_confidence (float): Lowest confidence at which a result is trusted; Latin-script
+                profiles cover a closed set of languages, so unknown languages still get a
+                low-margin guess that must not be trusted
+            min_letters (int): Latin-script texts shorter than this are not guessed at
+        """
+        self._min_confidence = min_confidence
+        self._min_letters = min_letters
+        self._stats = {
+            'identified': 0,
+            'uncertain': 0,
+        }
+
+    def identify(self, text):
+        """
+        Identify the language of a text
+
+        Args:
+            text (str): Text to analyze
+
+        Returns:
+            tuple: (language code or None, confidence between 0 and 1)
+        """
+        text = _NOISE.sub(' ', text)
+        script, letters = self._dominant_script(text)
+        if script is None:
+            return None, 0.0
+
+        if script == 'han' and 'kana' in letters:
+            # Japanese mixes kanji with kana; Chinese never uses kana
+            return 'ja', 1.0
+        if script in SCRIPT_LANGUAGES:
+            return SCRIPT_LANGUAGES[script], 1.0
+        if script in SCRIPT_LETTER_HINTS:
+            hints, default = SCRIPT_LETTER_HINTS[script]
+            lowered = text.lower()
+            for language, hint_letters in hints:
+                if any(letter in lowered for letter in hint_letters):
+                    return language, 0.9
+            return default, self.SCRIPT_DEFAULT_CONFIDENCE
+        if script == 'latin':
+            if letters['latin'] < self._min_letters:
+                return None, 0.0
+            return self._identify_latin(text)
+
+        return None, 0.0
+
+    def detect(self, text):
+        """
+        Identify a language only when the result is trustworthy
+
+        Args:
+            text (str): Text to analyze
+
+        Returns:
+            str: Language code, or None if the text is too short or ambiguous
+        """
+        language, confidence = self.identify(text)
+        if language and confidence >= self._min_confidence:
+            self._stats['identified'] += 1
+            return language
+
+        self._stats['uncertain'] += 1
+        return None
+
+    def _dominant_script(self, text):
+        """Find the script most letters of the text are written in, with per-script letter counts"""
+        letters = {}
+        for char in text:
+            if not char.isalpha():
+                continue
+            code_point = ord(char)
+            index = bisect.bisect_right(_RANGE_STARTS, code_point) - 1
+            if index >= 0 and code_point <= SCRIPT_RANGES[index][1]:
+                script = SCRIPT_RANGES[index][2]
+                letters[script] = letters.get(script, 0) + 1
+
+        if not letters:
+            return None, letters
+
+        # Kanji and kana are both Japanese, so count them together against other scripts
+        scored = dict(letters)
+        if 'kana' in scored and 'han' in scored:
+            scored['han'] += scored.pop('kana')
+        return max(scored, key=scored.get), letters
+
+    def _identify_latin(self, text):
+        """Score Latin-script text against every trigram profile and letter hint"""
+        words = _NON_LETTERS.sub(' ', text.lower()).split()
+        trigrams = []
+        for word in words:
+            padded = f" {word} "
+            trigrams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+        if not trigrams:
+            return None, 0.0
+
+        scores = dict.fromkeys(TRIGRAM_PROFILES, 0.0)
+        for trigram in trigrams:
+            for language, weight in _TRIGRAM_INDEX.get(trigram, ()):
+                scores[language] += weight
+
+        hint_letters = set(''.join(words))
+        hint_scale = self.LETTER_HINT_WEIGHT * len(trigrams) ** 0.5
+        for language, hints in LATIN_LETTER_HINTS.items():
+            scores[language] += hint_scale * len(hint_letters.intersection(hints))
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (best, best_score), (_, runner_up) = ranked[0], ranked[1]
+        if best_score <= 0:
+            return None, 0.0
+        # Confidence is the best profile's lead over the next one per trigram of text. Related
+        # languages share many trigrams, so ordinary text still leads clearly when the language
+        # is known, while a language outside the profiles scores low everywhere and barely leads.
+        lead = (best_score - runner_up) / len(trigrams)
+        return best, min(1.0, lead / self.FULL_CONFIDENCE_LEAD)
+
+    def get_stats(self):
+        """
+        Get identification counters
+
+        Returns:
+            dict: Identifier statistics
+        """
+        return dict(self._stats)
@@ -0,0 +1,261 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Google Translate's language table (name -> code) as deep-translator reports it,
+# bundled so the bot can validate targets when the live table cannot be loaded
+BUNDLED_LANGUAGES = {
+    'afrikaans': 'af',
+    'albanian': 'sq',
+    'amharic': 'am',
+    'arabic': 'ar',
+    'armenian': 'hy',
+    'assamese': 'as',
+    'aymara': 'ay',
+    'azerbaijani': 'az',
+    'bambara': 'bm',
+    'basque': 'eu',
+    'belarusian': 'be',
+    'bengali': 'bn',
+    'bhojpuri': 'bho',
+    'bosnian': 'bs',
+    'bulgarian': 'bg',
+    'catalan': 'ca',
+    'cebuano': 'ceb',
+    'chichewa': 'ny',
+    'chinese (simplified)': 'zh-CN',
+    'chinese (traditional)': 'zh-TW',
+    'corsican': 'co',
+    'croatian': 'hr',
+    'czech': 'cs',
+    'danish': 'da',
+    'dhivehi': 'dv',
+    'dogri': 'doi',
+    'dutch': 'nl',
+    'english': 'en',
+    'esperanto': 'eo',
+    'estonian': 'et',
+    'ewe': 'ee',
+    'filipino': 'tl',
+    'finnish': 'fi',
+    'french': 'fr',
+    'frisian': 'fy',
+    'galician': 'gl',
+    'georgian': 'ka',
+    'german': 'de',
+    'greek': 'el',
+    'guarani': 'gn',
+    'gujarati': 'gu',
+    'haitian creole': 'ht',
+    'hausa': 'ha',
+    'hawaiian': 'haw',
+    'hebrew': 'iw',
+    'hindi': 'hi',
+    'hmong': 'hmn',
+    'hungarian': 'hu',
+    'icelandic': 'is',
+    'igbo': 'ig',
+    'ilocano': 'ilo',
+    'indonesian': 'id',
+    'irish': 'ga',
+    'italian': 'it',
+    'japanese': 'ja',
+    'javanese': 'jw',
+    'kannada': 'kn',
+    'kazakh': 'kk',
+    'khmer': 'km',
+    'kinyarwanda': 'rw',
+    'konkani': 'gom',
+    'korean': 'ko',
+    'krio': 'kri',
+    'kurdish (kurmanji)': 'ku',
+    'kurdish (sorani)': 'ckb',
+    'kyrgyz': 'ky',
+    'lao': 'lo',
+    'latin': 'la',
+    'latvian': 'lv',
+    'lingala': 'ln',
+    'lithuanian': 'lt',
+    'luganda': 'lg',
+    'luxembourgish': 'lb',
+    'macedonian': 'mk',
+    'maithili': 'mai',
+    'malagasy': 'mg',
+    'malay': 'ms',
+    'malayalam': 'ml',
+    'maltese': 'mt',
+    'maori': 'mi',
+    'marathi': 'mr',
+    'meiteilon (manipuri)': 'mni-Mtei',
+    'mizo': 'lus',
+    'mongolian': 'mn',
+    'myanmar': 'my',
+    'nepali': 'ne',
+    'norwegian': 'no',
+    'odia (oriya)': 'or',
+    'oromo': 'om',
+    'pashto': 'ps',
+    'persian': 'fa',
+    'polish': 'pl',
+    'portuguese': 'pt',
+    'punjabi': 'pa',
+    'quechua': 'qu',
+    'romanian': 'ro',
+    'russian': 'ru',
+    'samoan': 'sm',
+    'sanskrit': 'sa',
+    'scots gaelic': 'gd',
+    'sepedi': 'nso',
+    'serbian': 'sr',
+    'sesotho': 'st',
+    'shona': 'sn',
+    'sindhi': 'sd',
+    'sinhala': 'si',
+    'slovak': 'sk',
+    'slovenian': 'sl',
+    'somali': 'so',
+    'spanish': 'es',
+    'sundanese': 'su',
+    'swahili': 'sw',
+    'swedish': 'sv',
+    'tajik': 'tg',
+    'tamil': 'ta',
+    'tatar': 'tt',
+    'telugu': 'te',
+    'thai': 'th',
+    'tigrinya': 'ti',
+    'tsonga': 'ts',
+    'turkish': 'tr',
+    'turkmen': 'tk',
+    'twi': 'ak',
+    'ukrainian': 'uk',
+    'urdu': 'ur',
+    'uyghur': 'ug',
+    'uzbek': 'uz',
+    'vietnamese': 'vi',
+    'welsh': 'cy',
+    'xhosa': 'xh',
+    'yiddish': 'yi',
+    'yoruba': 'yo',
+    'zulu': 'zu',
+}
+
+# Our language codes that Google spells differently
+CODE_ALIASES = {'zh': 'zh-CN', 'he': 'iw', 'jv': 'jw'}
+
+def to_backend_code(language_code):
+    """
+    Spell a language code the way Google Translate expects it
+
+    Args:
+        language_code (str): Our language code, or 'auto'
+
+    Returns:
+        str: Google's code for the language (unknown codes are returned unchanged)
+    """
+    return CODE_ALIASES.get(language_code, language_code)
+
+def load_backend_languages():
+    """
+    Load Google Translate's language table from deep-translator
+
+    Blocking; run it on an executor thread.
+
+    Returns:
+        dict: Language name -> Google language code, or None if it could not be loaded
+    """
+    try:
+        from deep_translator import GoogleTranslator
+
+        return GoogleTranslator().get_supported_languages(as_dict=True) or None
+    except Exception as e:
+        logger.warning(f"Could not load the backend language table: {e}")
+        return None
+
+class LanguageRegistry:
+    """Supported target languages, looked up in O(1) before any translation request is queued"""
+
+    def __init__(self, languages=None):
+        """
+        Args:
+            languages (dict): Language name -> Google code; defaults to the bundled snapshot
+        """
+        self._codes = {}
+        self._names = {}
+        self._origin = None
+        self._rejected = 0
+        self.update(languages or BUNDLED_LANGUAGES, origin='bundled')
+
+    @property
+    def origin(self):
+        """Where the current table came from: 'bundled' or 'backend'"""
+        return self._origin
+
+    def update(self, languages, origin):
+        """
+        Replace the language table
+
+        Args:
+            languages (dict): Language name -> Google code
+            origin (str): Where the table came from, for stats
+        """
+        names = {code: name.title() for name, code in languages.items()}
+        # Accept Google's codes and our own spellings, case-insensitively
+        codes = {code.lower(): code for code in names}
+        for alias, code in CODE_ALIASES.items():
+            if code in names:
+                codes[alias] = code
+
+        self._names = names
+        self._codes = codes
+        self._origin = origin
+        logger.info(f"Language registry has {len(names)} languages ({origin})")
+
+    def normalize(self, language_code):
+        """
+        Get Google's code for a language
+
+        Args:
+            language_code (str): Our or Google's language code, in any case
+
+        Returns:
+            str: Google's language code, or None if the language is not supported
+        """
+        return self._codes.get(language_code.lower())
+
+    def is_supported(self, language_code):
+        """
+        Check whether a language can be translated to, counting rejections
+
+        Args:
+            language_code (str): Language code
+
+        Returns:
+            bool: True if the backend supports the language
+        """
+        if language_code.lower() in self._codes:
+            return True
+        self._rejected += 1
+        return False
+
+    def get_languages(self):
+        """
+        Get the supported languages
+
+        Returns:
+            dict: Google language code -> language name
+        """
+        return dict(self._names)
+
+    def get_stats(self):
+        """
+        Get registry statistics
+
+        Returns:
+            dict: Table origin, size and rejected lookups
+        """
+        return {
+            'origin': self._origin,
+            'languages': len(self._names),
+            'rejected': self._rejected,
+        }
@@ -175,6 +175,9 @@ EMOJI_TO_LANGUAGE = {
     '🏴󠁧󠁢󠁷󠁬󠁳󠁿': 'cy',  # Wales -> Welsh
 }
 
+# Every flag that triggers a translation, for an O(1) check before any other work on a reaction
+FLAG_EMOJIS = frozenset(EMOJI_TO_LANGUAGE)
+
 # Alternative mapping for common language requests
 LANGUAGE_ALIASES = {
     'english': 'en',
@@ -2,11 +2,20 @@ import discord
 from discord.ext import commands
 import asyncio
 import logging
+from deadline import Deadline
+from event_dedupe import EventDeduplicator
+from message_cache import RecentMessageCache
+from speculative_translation import SpeculativeTranslator
 from translate import TranslationService
-from languages import EMOJI_TO_LANGUAGE
-from config import BOT_TOKEN
+from translation_types import DeadlineExceededError, TranslationError, TranslationResult
+from user_cache import MinimalUser, UserNameCache
+from languages import EMOJI_TO_LANGUAGE, FLAG_EMOJIS
+from text_chunking import paginate_text
+from config import BOT_TOKEN, DISCORD_CONFIG, FEATURE_FLAGS, TRANSLATION_CONFIG
 import threading
+import json
 import os
+import sys
 import time
 from http.server import HTTPServer, BaseHTTPRequestHandler
 
@@ -20,13 +29,53 @@ intents.message_content = True
 intents.reactions = True
 intents.guilds = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+class EchoLangBot(commands.Bot):
+    """Bot that releases the translation service's sessions, threads and cache file on shutdown"""
+    
+    async def close(self):
+        await super().close()
+        await translation_service.close()
+        logger.info("Translation service closed")
+
+bot = EchoLangBot(command_prefix='!', intents=intents)
 translation_service = TranslationService()
+# Raw reaction events seen, and how many were dropped before any work because they are not flags
+reaction_metrics = {'received': 0, 'dropped_non_flag': 0}
+# (message_id, emoji, user_id) of recent flag reactions, so a redelivered gateway event is handled once
+reaction_dedupe = EventDeduplicator(ttl=DISCORD_CONFIG['reaction_dedupe_ttl'])
+# Messages seen recently, so flag reactions on them need no fetch_message round trip
+recent_messages = RecentMessageCache(max_entries=DISCORD_CONFIG['recent_message_cache_size'])
+# Names of users seen recently, so reactions are attributed without a fetch_user round trip
+user_names = UserNameCache(max_entries=DISCORD_CONFIG['user_name_cache_size'])
+# Background fetch_user calls filling the name cache: user_id -> task
+pending_user_fetches = {}
+
+# Opt-in: pre-translate new messages in busy channels so flag reactions hit the cache
+speculative_translator = None
+if FEATURE_FLAGS.get('enable_speculative_translation', False):
+    speculative_translator = SpeculativeTranslator(
+        translation_service,
+        max_languages=TRANSLATION_CONFIG['speculative_languages'],
+        min_reactions=TRANSLATION_CONFIG['speculative_min_reactions'],
+        min_share=TRANSLATION_CONFIG['speculative_min_share'],
+        budget_per_minute=TRANSLATION_CONFIG['speculative_budget_per_minute'],
+        half_life=TRANSLATION_CONFIG['speculative_half_life'],
+        max_length=TRANSLATION_CONFIG['speculative_max_length']
+    )
 
 # Store active threads for cleanup - now with better structure
 active_threads = {}
 # Store thread deletion tasks for cancellation
 thread_deletion_tasks = {}
+# Flag reactions waiting to be translated, per message: message_id -> {language_code: user}
+pending_translations = {}
+# Latest deadline among a message's pending reactions: message_id -> Deadline
+pending_deadlines = {}
+# Discord's limit on an embed description
+EMBED_DESCRIPTION_LIMIT = 4096
+# Discord allows at most 10 embeds and 6000 characters of embed text per message
+MESSAGE_EMBED_LIMIT = 10
+MESSAGE_EMBED_TOTAL_LIMIT = 6000
 
 class ThreadManager:
     """Manages thread lifecycle including guaranteed cleanup"""
@@ -62,6 +111,16 @@ class ThreadManager:
             logger.error(f"Failed to create thread: {e}")
             raise
     
+    @staticmethod
+    async def get_translation_thread(message, user):
+        """Get the message's translation thread, creating it if needed"""
+        if message.id in active_threads:
+            thread = active_threads[message.id]['thread']
+            logger.info(f"Using existing thread {thread.id} for message {message.id}")
+            return thread
+        
+        return await ThreadManager.create_translation_thread(message, user)
+    
     @staticmethod
     def schedule_thread_deletion(thread, message_id):
         """Schedule thread deletion with guaranteed execution"""
@@ -120,68 +179,219 @@ class TranslationHandler:
     """Handles translation requests with proper error handling"""
     
     @staticmethod
-    async def handle_translation_request(thread, message, language_code, user):
-        """Handle a translation request with comprehensive error handling"""
-        translation_posted = False
-        error_message = None
+    async def handle_translation_request(message, language_code, user, deadline=None):
+        """
+        Handle a translation request, aggregating bursts of flags on the same message
         
-        try:
-            # Check if already translated
-            message_id = message.id
-            if message_id in active_threads and language_code in active_threads[message_id]['translations']:
-                logger.info(f"Language {language_code} already translated for message {message.id}")
-                return True
+        The first request for a message waits a short window for more flags (skipped when
+        its translation is already cached), then one thread lookup, one translate_many call
+        and one post cover all of them. Flags that arrive while that runs are picked up in
+        a follow-up round.
+        
+        Args:
+            message: Message being translated
+            language_code (str): Requested language code
+            user: User who requested it
+            deadline (Deadline): Time budget for the translation, or None
             
-            # Reset the deletion timer since there's new activity
-            ThreadManager.schedule_thread_deletion(thread, message_id)
+        Returns:
+            bool: True if a translation was posted, or the request joined another one
             
-            # Attempt translation
-            logger.info(f"Translating message to {language_code}")
-            translated_text = await translation_service.translate(message.content, language_code)
+        Raises:
+            discord.Forbidden: The translation thread could not be created
+        """
+        message_id = message.id
+        
+        # Another request for this message is gathering flags or running - join it
+        if message_id in pending_translations:
+            pending_translations[message_id].setdefault(language_code, user)
+            pending_deadlines[message_id] = Deadline.later(pending_deadlines.get(message_id), deadline)
+            logger.info(f"Queued {language_code} with pending translations for message {message_id}")
+            return True
+        
+        pending_translations[message_id] = {language_code: user}
+        pending_deadlines[message_id] = deadline
+        translation_posted = False
+        try:
+            # Let the rest of a burst of flags arrive before translating, unless the answer is already cached
+            if not await translation_service.is_cached(message.content, language_code):
+                window = TRANSLATION_CONFIG['reaction_aggregation_window']
+                await asyncio.sleep(deadline.cap(window) if deadline else window)
             
-            # Check if translation was successful
-            if translated_text and not translated_text.startswith('[') and not translated_text.startswith('Translation'):
-                # Mark as translated
-                active_threads[message_id]['translations'].add(language_code)
-                
-                # Create success embed
-                language_name = get_language_name(language_code)
-                embed = discord.Embed(
-                    title=f"Translation ({language_name})",
-                    description=translated_text,
-                    color=0x00ff00
-                )
-                embed.set_footer(text=f"Translated by {user.display_name if hasattr(user, 'display_name') else user.name} • EchoLang by mythicavalon • Support: paypal.me/amalnair11")
-                
-                await thread.send(embed=embed)
-                logger.info(f"Posted successful translation to thread {thread.id}")
-                translation_posted = True
-                
+            thread = await ThreadManager.get_translation_thread(message, user)
+            while pending_translations[message_id]:
+                requests = pending_translations[message_id]
+                pending_translations[message_id] = {}
+                # Queued reactions extend the batch's budget to the latest of their deadlines
+                batch_deadline = pending_deadlines[message_id]
+                if await TranslationHandler.handle_translation_batch(thread, message, requests, batch_deadline):
+                    translation_posted = True
+        finally:
+            del pending_translations[message_id]
+            del pending_deadlines[message_id]
+        
+        return translation_posted
+    
+    @staticmethod
+    async def handle_translation_batch(thread, message, requests, deadline=None):
+        """
+        Translate a message into every requested language in one round and post the results together
+        
+        Args:
+            thread: Translation thread for the message
+            message: Message being translated
+            requests (dict): Language code -> user who requested it
+            deadline (Deadline): Time budget for the translations, or None
+            
+        Returns:
+            bool: True if at least one translation was posted
+        """
+        message_id = message.id
+        
+        # Check if already translated
+        if message_id in active_threads:
+            translated = active_threads[message_id]['translations']
+            for language_code in [code for code in requests if code in translated]:
+                logger.info(f"Language {language_code} already translated for message {message.id}")
+                del requests[language_code]
+        
+        if not requests:
+            return True
+        
+        # Reset the deletion timer since there's new activity
+        ThreadManager.schedule_thread_deletion(thread, message_id)
+        
+        try:
+            logger.info(f"Translating message to {', '.join(requests)}")
+            if len(requests) == 1:
+                language_code = next(iter(requests))
+                try:
+                    results = {language_code: await translation_service.translate(message.content, language_code, deadline=deadline)}
+                except TranslationError as e:
+                    results = {language_code: e}
             else:
-                # Translation failed - post error to thread
-                error_message = translated_text if translated_text else "Translation service unavailable"
-                
+                results = await translation_service.translate_many(message.content, list(requests), deadline=deadline)
         except Exception as e:
             logger.error(f"Translation error: {e}")
-            error_message = f"Translation error: {str(e)}"
+            results = {language_code: None for language_code in requests}
+            error = f"Translation error: {str(e)}"
+        else:
+            error = None
         
-        # If translation failed, post error message to thread
-        if not translation_posted and error_message:
-            try:
-                language_name = get_language_name(language_code)
-                error_embed = discord.Embed(
-                    title=f"Translation Error ({language_name})",
-                    description=f"❌ {error_message}",
-                    color=0xff0000
+        embeds = []
+        translated_languages = []
+        for language_code, user in requests.items():
+            language_embeds, translated = TranslationHandler.build_translation_embeds(
+                language_code, user, results.get(language_code), error
+            )
+            embeds.extend(language_embeds)
+            if translated:
+                translated_languages.append(language_code)
+        
+        if not await TranslationHandler.send_embeds(thread, embeds):
+            return False
+        
+        if message_id in active_threads:
+            active_threads[message_id]['translations'].update(translated_languages)
+        logger.info(f"Posted {len(embeds)} embeds for {', '.join(requests)} to thread {thread.id}")
+        return bool(translated_languages)
+    
+    @staticmethod
+    def build_translation_embeds(language_code, user, result, error_message=None):
+        """
+        Build the embeds for one language's translation result (or its error)
+        
+        Args:
+            language_code (str): Target language code
+            user: User who requested the translation
+            result: TranslationResult, the TranslationError it failed with, or None
+            error_message (str): Error to show instead of the result
+            
+        Returns:
+            tuple: (list of embeds, True if the language counts as translated)
+        """
+        language_name = get_language_name(language_code)
+        requester = user.display_name if hasattr(user, 'display_name') else user.name
+        
+        # Ran out of time - say so instead of a generic error
+        if isinstance(result, DeadlineExceededError):
+            timeout_embed = discord.Embed(
+                title=f"Translation Timed Out ({language_name})",
+                description="⏱️ The translation took too long. Remove and re-add the flag to try again.",
+                color=0xffa500
+            )
+            timeout_embed.set_footer(text=f"Requested by {requester}")
+            return [timeout_embed], False
+        
+        # The message is empty, already in the requested language or only links, mentions or code
+        if isinstance(result, TranslationResult) and not result.translated:
+            embed = discord.Embed(
+                title=f"Translation ({language_name})",
+                description=f"ℹ️ {result.notice}",
+                color=0x3498db
+            )
+            embed.set_footer(text=f"Requested by {requester}")
+            logger.info(f"No {language_code} translation needed: {result.notice}")
+            return [embed], True
+        
+        if isinstance(result, TranslationResult) and result.text:
+            # One page per embed for translations over the description limit
+            pages = paginate_text(result.text, EMBED_DESCRIPTION_LIMIT)
+            embeds = []
+            for page_number, page in enumerate(pages, start=1):
+                title = f"Translation ({language_name})"
+                if len(pages) > 1:
+                    title += f" {page_number}/{len(pages)}"
+                embed = discord.Embed(
+                    title=title,
+                    description=page,
+                    color=0x00ff00
                 )
-                error_embed.set_footer(text=f"Requested by {user.display_name if hasattr(user, 'display_name') else user.name}")
-                
-                await thread.send(embed=error_embed)
-                logger.info(f"Posted error message to thread {thread.id}")
-            except Exception as post_error:
-                logger.error(f"Failed to post error message to thread: {post_error}")
+                if page_number == len(pages):
+                    embed.set_footer(text=f"Translated by {requester} • EchoLang by mythicavalon • Support: paypal.me/amalnair11")
+                embeds.append(embed)
+            logger.info(f"Translated to {language_code} ({len(pages)} embeds, backend={result.backend}, "
+                        f"cache_hit={result.cache_hit}, latency={result.latency:.2f}s)")
+            return embeds, True
         
-        return translation_posted
+        if not error_message:
+            error_message = str(result) if isinstance(result, TranslationError) else "Translation service unavailable"
+        error_embed = discord.Embed(
+            title=f"Translation Error ({language_name})",
+            description=f"❌ {error_message}",
+            color=0xff0000
+        )
+        error_embed.set_footer(text=f"Requested by {requester}")
+        return [error_embed], False
+    
+    @staticmethod
+    async def send_embeds(thread, embeds):
+        """
+        Post embeds to the thread in as few messages as Discord's limits allow
+        
+        Args:
+            thread: Translation thread
+            embeds (list): Embeds to post, in order
+            
+        Returns:
+            bool: True if every message was sent
+        """
+        batch = []
+        batch_length = 0
+        try:
+            for embed in embeds:
+                if batch and (len(batch) == MESSAGE_EMBED_LIMIT or batch_length + len(embed) > MESSAGE_EMBED_TOTAL_LIMIT):
+                    await thread.send(embeds=batch)
+                    batch, batch_length = [], 0
+                batch.append(embed)
+                batch_length += len(embed)
+            if batch:
+                await thread.send(embeds=batch)
+        except Exception as post_error:
+            logger.error(f"Failed to post translations to thread: {post_error}")
+            return False
+        
+        return True
 
 @bot.event
 async def on_ready():
@@ -196,6 +406,9 @@ async def on_ready():
     )
     await bot.change_presence(activity=activity, status=discord.Status.online)
     
+    # Load the backend's language table once so unsupported flags are rejected up front
+    await translation_service.load_supported_languages()
+    
     # Sync slash commands
     try:
         synced = await bot.tree.sync()
@@ -210,130 +423,154 @@ async def on_ready():
         if member:
             logger.info(f"Bot permissions: {member.guild_permissions}")
 
+@bot.listen('on_message')
+async def track_new_message(message):
+    """Remember new messages for the reaction path and queue them for pre-translation (a listener, so commands still run)"""
+    recent_messages.add(message)
+    user_names.remember(message.author)
+    if speculative_translator:
+        speculative_translator.record_message(message)
+
+@bot.event
+async def on_raw_message_edit(payload):
+    """Keep remembered messages in sync with their edits"""
+    if payload.message is not None:
+        recent_messages.add(payload.message)
+    elif 'content' in payload.data:
+        recent_messages.update_content(payload.message_id, payload.data['content'])
+
 @bot.event
 async def on_raw_reaction_add(payload):
     """Handle raw reaction events"""
+    reaction_metrics['received'] += 1
+    
+    # Most reactions are not flags - drop them before logging, lookups or API calls
+    emoji_str = str(payload.emoji)
+    if emoji_str not in FLAG_EMOJIS:
+        reaction_metrics['dropped_non_flag'] += 1
+        return
+    
     logger.info(f"Raw reaction event: {payload.emoji} by user {payload.user_id}")
     
     # Skip bot's own reactions
     if payload.user_id == bot.user.id:
         return
     
+    if reaction_dedupe.seen((payload.message_id, emoji_str, payload.user_id)):
+        logger.info(f"Dropping duplicate reaction {emoji_str} on message {payload.message_id}")
+        return
+    
+    # Everything this reaction triggers, from fetching the message to posting the translation, shares one budget
+    deadline = Deadline(TRANSLATION_CONFIG['reaction_deadline'])
+    
     # Get the actual reaction and user objects
     channel = bot.get_channel(payload.channel_id)
     if not channel:
         logger.error(f"Channel {payload.channel_id} not found")
         return
         
-    try:
-        message = await channel.fetch_message(payload.message_id)
+    # Resolved from the payload and caches, never an API call
+    user = get_user_from_payload(payload)
         
-        # Try to get user with multiple methods
-        user = await get_user_from_payload(payload)
-        if not user:
-            logger.error(f"Could not resolve user {payload.user_id}")
-            return
+    try:
+        # Recently seen messages need no REST round trip; fetch only the rest
+        message = recent_messages.get(channel, payload.message_id)
+        if message is None:
+            message = await deadline.wait_for(channel.fetch_message(payload.message_id))
             
         if not message:
             logger.error(f"Message {payload.message_id} not found")
             return
             
         logger.info(f"Processing reaction {payload.emoji} from user {user.name}")
-        
-        # Find the reaction object
-        reaction_found = False
-        for reaction in message.reactions:
-            if str(reaction.emoji) == str(payload.emoji):
-                logger.info(f"Found matching reaction, calling handler")
-                await on_reaction_add(reaction, user)
-                reaction_found = True
-                break
-                
-        if not reaction_found:
-            logger.error(f"Reaction {payload.emoji} not found in message reactions")
+        await handle_reaction(message, emoji_str, user, deadline)
             
+    except asyncio.TimeoutError:
+        logger.error(f"Reaction {payload.emoji} on message {payload.message_id} ran out of time before translation")
     except Exception as e:
         logger.error(f"Error in raw reaction handler: {e}")
 
-async def get_user_from_payload(payload):
-    """Get user object from payload with multiple fallback methods"""
-    user = None
-    
-    # Try to get channel for guild context
-    channel = bot.get_channel(payload.channel_id)
+@bot.event
+async def on_raw_reaction_remove(payload):
+    """Forget a removed flag reaction, so adding it again counts as a new request"""
+    emoji_str = str(payload.emoji)
+    if emoji_str in FLAG_EMOJIS:
+        reaction_dedupe.forget((payload.message_id, emoji_str, payload.user_id))
+
+def get_user_from_payload(payload):
+    """
+    Resolve the reacting user without any API call
     
-    # Method 1: Guild member (works with members intent)
-    if hasattr(channel, 'guild') and channel.guild:
-        user = channel.guild.get_member(payload.user_id)
-        if user:
-            logger.info(f"Found user via guild member: {user.name}")
-            return user
+    Guild reactions carry the member in the payload. Otherwise the name cache or
+    the client's user cache is used; if neither knows the user, a placeholder is
+    returned and their name is fetched in the background for next time.
     
-    # Method 2: Bot user cache
-    user = bot.get_user(payload.user_id)
+    Args:
+        payload (discord.RawReactionActionEvent): The reaction event
+        
+    Returns:
+        The member, user, or a MinimalUser stand-in
+    """
+    if payload.member is not None:
+        user_names.remember(payload.member)
+        return payload.member
+    
+    user = user_names.get(payload.user_id) or bot.get_user(payload.user_id)
     if user:
-        logger.info(f"Found user via bot cache: {user.name}")
         return user
     
-    # Method 3: Fetch user directly
+    if payload.user_id not in pending_user_fetches:
+        task = asyncio.create_task(fetch_user_name(payload.user_id))
+        pending_user_fetches[payload.user_id] = task
+        task.add_done_callback(lambda done, user_id=payload.user_id: pending_user_fetches.pop(user_id, None))
+    
+    logger.info(f"Using fallback user object for {payload.user_id}")
+    return MinimalUser(payload.user_id)
+
+async def fetch_user_name(user_id):
+    """Fetch a user off the reaction path and remember their names"""
     try:
-        user = await bot.fetch_user(payload.user_id)
-        if user:
-            logger.info(f"Found user via fetch: {user.name}")
-            return user
+        user_names.remember(await bot.fetch_user(user_id))
     except Exception as e:
-        logger.error(f"Error fetching user: {e}")
-    
-    # Method 4: Create minimal user object as fallback
-    class MinimalUser:
-        def __init__(self, user_id):
-            self.id = user_id
-            self.name = f"User_{user_id}"
-            self.bot = False
-            
-    user = MinimalUser(payload.user_id)
-    logger.info(f"Using fallback user object for {payload.user_id}")
-    return user
+        logger.error(f"Error fetching user {user_id}: {e}")
 
-@bot.event
-async def on_reaction_add(reaction, user):
-    """Handle emoji reactions added to messages"""
-    logger.info(f"Reaction detected: {reaction.emoji} by {user.name}")
-    
+async def handle_reaction(message, emoji_str, user, deadline=None):
+    """
+    Translate a message for a flag reaction
+    
+    Args:
+        message: The reacted message - a discord.Message, or a CachedMessage from the recent message cache
+        emoji_str (str): The reaction emoji
+        user: User who reacted
+        deadline (Deadline): Time budget for the translation, or None for the configured default
+    """
     # Ignore bot's own reactions
     if user.bot:
         logger.info(f"Ignoring bot reaction from {user.name}")
         return
     
     # Check if reaction is a flag emoji
-    emoji_str = str(reaction.emoji)
     logger.info(f"Checking emoji: {emoji_str}")
     if emoji_str not in EMOJI_TO_LANGUAGE:
         logger.info(f"Emoji {emoji_str} not in supported languages")
         return
     
     language_code = EMOJI_TO_LANGUAGE[emoji_str]
-    message = reaction.message
+    
+    if speculative_translator:
+        speculative_translator.record_reaction(message.channel.id, language_code)
     
     # Skip if message is empty or from a bot
     if not message.content or message.author.bot:
         return
     
-    thread = None
+    if deadline is None:
+        deadline = Deadline(TRANSLATION_CONFIG['reaction_deadline'])
+    
     try:
-        # Check if thread already exists for this message
-        message_id = message.id
-        
-        if message_id in active_threads:
-            thread = active_threads[message_id]['thread']
-            logger.info(f"Using existing thread {thread.id} for message {message.id}")
-        else:
-            # Create new thread
-            thread = await ThreadManager.create_translation_thread(message, user)
-        
-        # Handle the translation request
+        # Handle the translation request; the thread is looked up or created once per burst of flags
         success = await TranslationHandler.handle_translation_request(
-            thread, message, language_code, user
+            message, language_code, user, deadline
         )
         
         if success:
@@ -351,6 +588,7 @@ async def on_reaction_add(reaction, user):
     except Exception as e:
         logger.error(f"Error handling reaction: {e}")
         # If we have a thread, try to post the error there
+        thread = active_threads.get(message.id, {}).get('thread')
         if thread:
             try:
                 error_embed = discord.Embed(
@@ -641,6 +879,20 @@ async def on_error(event, *args, **kwargs):
 # Health check server for Render
 class HealthHandler(BaseHTTPRequestHandler):
     def do_GET(self):
+        if self.path == '/metrics':
+            body = json.dumps({
+                'reactions': reaction_metrics,
+                'reaction_dedupe': reaction_dedupe.get_stats(),
+                'recent_messages': recent_messages.get_stats(),
+                'user_names': user_names.get_stats(),
+                'speculative_translation': speculative_translator.get_stats() if speculative_translator else None,
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        
         self.send_response(200)
         self.end_headers()
         self.wfile.write(b"EchoLang Bot is running")
@@ -666,11 +918,6 @@ if __name__ == "__main__":
         logger.info("Bot stopped by user")
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
-        # Auto-restart on crashes for production
-        import time
-        time.sleep(5)
-        logger.info("Attempting to restart bot...")
-        try:
-            bot.run(BOT_TOKEN)
-        except Exception as restart_error:
-            logger.error(f"Restart failed: {restart_error}")
+        # bot.run closed the bot and the translation service on the way out, so neither can be
+        # started again in this process; exit non-zero and let the host restart it
+        sys.exit(1)
@@ -0,0 +1,82 @@
+import re
+
+# Discord markup and other spans that must reach the reader untouched, matched in one pass.
+# Code blocks come first so mentions or URLs inside them stay part of the block.
+_PROTECTED = re.compile(
+    r'```.*?```'                      # code blocks
+    r'|`[^`\n]+`'                     # inline code
+    r'|<a?:\w+:\d+>'                  # custom emoji
+    r'|<@[!&]?\d+>'                   # user and role mentions
+    r'|<#\d+>'                        # channel links
+    r'|</[\w -]+:\d+>'                # slash command mentions
+    r'|<t:-?\d+(?::[tTdDfFR])?>'      # timestamps
+    r'|<https?://[^\s>]+>'            # URLs with embeds suppressed
+    r'|https?://[^\s<>]+'             # URLs
+    r'|@(?:everyone|here)\b'          # mass mentions
+    r'|\{\d+\}',                      # literal placeholders, so restoring cannot confuse them
+    re.DOTALL
+)
+# Placeholders as translation engines return them, sometimes spaced out or in full-width braces
+_PLACEHOLDER = re.compile(r'[{｛]\s*(\d+)\s*[}｝]')
+
+def protect_markup(text):
+    """
+    Replace markup spans with numbered {n} placeholders
+
+    Args:
+        text (str): Message text
+
+    Returns:
+        tuple: (text with placeholders, list of the replaced spans in placeholder order)
+    """
+    spans = []
+
+    def placeholder(match):
+        spans.append(match.group())
+        return f"{{{len(spans) - 1}}}"
+
+    return _PROTECTED.sub(placeholder, text), spans
+
+def restore_markup(text, spans):
+    """
+    Put the original spans back in place of their placeholders
+
+    Placeholders the backend dropped are appended at the end, so no mention,
+    link or code block is ever lost.
+
+    Args:
+        text (str): Translated text with placeholders
+        spans (list): Spans returned by protect_markup
+
+    Returns:
+        str: Text with every span restored
+    """
+    if not spans:
+        return text
+
+    restored = set()
+
+    def original(match):
+        index = int(match.group(1))
+        if index >= len(spans):
+            return match.group()
+        restored.add(index)
+        return spans[index]
+
+    text = _PLACEHOLDER.sub(original, text)
+    missing = [span for index, span in enumerate(spans) if index not in restored]
+    if missing:
+        text = ' '.join([text, *missing])
+    return text
+
+def has_translatable_text(text):
+    """
+    Check whether placeholder-protected text has anything left to translate
+
+    Args:
+        text (str): Text returned by protect_markup
+
+    Returns:
+        bool: True if any letters remain outside the placeholders
+    """
+    return any(char.isalpha() for char in _PLACEHOLDER.sub('', text))
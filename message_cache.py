@@ -0,0 +1,116 @@
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class _Author:
+    """The only part of a message author the reaction path reads"""
+
+    __slots__ = ('bot',)
+
+    def __init__(self, bot):
+        self.bot = bot
+
+class CachedMessage:
+    """
+    A recently seen message standing in for a fetched discord.Message on the reaction path
+
+    Thread creation and reactions go through a PartialMessage, so they work without
+    fetching the message from the API.
+    """
+
+    __slots__ = ('_partial', 'id', 'channel', 'content', 'author')
+
+    def __init__(self, partial, content, author_is_bot):
+        """
+        Args:
+            partial (discord.PartialMessage): Message reference from channel.get_partial_message
+            content (str): Message text
+            author_is_bot (bool): Whether a bot wrote the message
+        """
+        self._partial = partial
+        self.id = partial.id
+        self.channel = partial.channel
+        self.content = content
+        self.author = _Author(author_is_bot)
+
+    async def create_thread(self, **kwargs):
+        return await self._partial.create_thread(**kwargs)
+
+    async def add_reaction(self, emoji):
+        return await self._partial.add_reaction(emoji)
+
+class RecentMessageCache:
+    """Bounded LRU of recent messages (id -> channel, content, author is bot), so reactions rarely need fetch_message"""
+
+    def __init__(self, max_entries=5000):
+        """
+        Args:
+            max_entries (int): Messages kept; the least recently used is dropped
+        """
+        self._max_entries = max_entries
+        self._entries = OrderedDict()  # message_id -> (channel_id, content, author_is_bot)
+        self._hits = 0
+        self._misses = 0
+
+    def add(self, message):
+        """
+        Remember a new or edited message
+
+        Args:
+            message (discord.Message): The message
+        """
+        self._entries[message.id] = (message.channel.id, message.content, message.author.bot)
+        self._entries.move_to_end(message.id)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def update_content(self, message_id, content):
+        """
+        Update the text of a remembered message after an edit
+
+        Args:
+            message_id (int): Edited message ID
+            content (str): New message text
+        """
+        entry = self._entries.get(message_id)
+        if entry is not None:
+            channel_id, _, author_is_bot = entry
+            self._entries[message_id] = (channel_id, content, author_is_bot)
+
+    def get(self, channel, message_id):
+        """
+        Get a remembered message
+
+        Args:
+            channel (discord.abc.Messageable): Channel the message is in
+            message_id (int): Message ID
+
+        Returns:
+            CachedMessage: The message, or None if it has not been seen recently
+        """
+        entry = self._entries.get(message_id)
+        if entry is None or entry[0] != channel.id:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(message_id)
+        _, content, author_is_bot = entry
+        return CachedMessage(channel.get_partial_message(message_id), content, author_is_bot)
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Size, hits, misses and hit ratio
+        """
+        lookups = self._hits + self._misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self._max_entries,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+        }
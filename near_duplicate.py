@@ -0,0 +1,88 @@
+import re
+from collections import OrderedDict
+
+# Words, ignoring casing, punctuation and spacing
+_WORD = re.compile(r'\w+')
+
+class NearDuplicateIndex:
+    """
+    Recently translated texts per target language, found again when a new text has the same words
+
+    Texts that differ only in casing, punctuation or spacing (copy-pasted announcements,
+    spam waves) share one entry. Texts whose words differ are never reused: in a long
+    text one changed word ("8pm" -> "9pm", an inserted "not") changes the meaning, and
+    the segment memory already translates only the sentences that changed.
+    """
+
+    def __init__(self, max_entries=2048):
+        """
+        Args:
+            max_entries (int): Texts kept across all target languages; the least recently used is dropped
+        """
+        self._max_entries = max_entries
+        self._entries = OrderedDict()  # (target, normalized words) -> translation, least recent first
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(text, target_language):
+        """Key a text by its lowercased word sequence, or None if it has no words"""
+        words = _WORD.findall(text.lower())
+        if not words:
+            return None
+        return target_language, ' '.join(words)
+
+    def find(self, text, target_language):
+        """
+        Find the stored translation of a text with the same words
+
+        Args:
+            text (str): Text about to be translated
+            target_language (str): Target language code
+
+        Returns:
+            str: Stored translation, or None if no text with the same words was translated
+        """
+        key = self._key(text, target_language)
+        translation = self._entries.get(key) if key else None
+        if translation is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return translation
+
+    def add(self, text, target_language, translation):
+        """
+        Remember a translation
+
+        Args:
+            text (str): Translated source text
+            target_language (str): Target language code
+            translation (str): Its translation
+        """
+        key = self._key(text, target_language)
+        if key is None:
+            return
+
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self):
+        """
+        Get index statistics
+
+        Returns:
+            dict: Entry count, limit and lookup counters
+        """
+        lookups = self._hits + self._misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self._max_entries,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from backends import TranslationBackend, register_backend
+
+logger = logging.getLogger(__name__)
+
+# Per-process worker state, filled by the pool initializer. Loaded translation
+# objects keep their CTranslate2 models in memory between requests.
+_worker_state = {
+    'translations': {},  # (source, target) -> argostranslate ITranslation
+    'packages_version': 0,
+}
+
+def _init_worker(package_dir, threads_per_worker):
+    """Pool initializer: configure and import argostranslate once per worker process"""
+    if package_dir:
+        os.environ['ARGOS_PACKAGES_DIR'] = package_dir
+    os.environ['ARGOS_DEVICE_TYPE'] = 'cpu'
+    os.environ['ARGOS_INTRA_THREADS'] = str(threads_per_worker)
+
+    import argostranslate.translate  # noqa: F401 - loads CTranslate2 and the installed package list
+
+def _warm_up(language_pairs):
+    """Load models for the given pairs so the first real request does not pay for it"""
+    for source_language, target_language in language_pairs:
+        try:
+            _get_worker_translation(source_language, target_language, _worker_state['packages_version'])
+        except Exception as e:
+            logger.warning(f"Could not preload {source_language}->{target_language}: {e}")
+
+def _get_worker_translation(source_language, target_language, packages_version):
+    """Get a cached translation object, reloading everything after new packages were installed"""
+    import argostranslate.translate
+
+    if packages_version != _worker_state['packages_version']:
+        _worker_state['translations'].clear()
+        _worker_state['packages_version'] = packages_version
+
+    key = (source_language, target_language)
+    translation = _worker_state['translations'].get(key)
+    if translation is None:
+        languages = {language.code: language for language in argostranslate.translate.get_installed_languages()}
+        source = languages.get(source_language)
+        target = languages.get(target_language)
+        translation = source.get_translation(target) if source and target else None
+        if translation is None:
+            raise ValueError(f"Unsupported language pair {source_language}->{target_language}: no installed model")
+        _worker_state['translations'][key] = translation
+
+    return translation
+
+def _translate_in_worker(text, source_language, target_language, packages_version):
+    """Translate text inside a worker process"""
+    return _get_worker_translation(source_language, target_language, packages_version).translate(text)
+
+def _installed_pairs_in_worker():
+    """List the installed (source, target) package pairs"""
+    from argostranslate import package
+
+    return [(pkg.from_code, pkg.to_code) for pkg in package.get_installed_packages()]
+
+def _install_pair_in_worker(source_language, target_language):
+    """
+    Download and install the packages needed for a language pair, pivoting through English
+
+    Returns:
+        list: Installed (source, target) package pairs after installation
+    """
+    from argostranslate import package
+
+    package.update_package_index()
+    available = {(pkg.from_code, pkg.to_code): pkg for pkg in package.get_available_packages()}
+    installed = set(_installed_pairs_in_worker())
+
+    if (source_language, target_language) in available:
+        needed = [(source_language, target_language)]
+    else:
+        needed = [(source_language, 'en'), ('en', target_language)]
+
+    for pair in needed:
+        if pair in installed:
+            continue
+        if pair not in available:
+            raise ValueError(f"Unsupported language pair {source_language}->{target_language}: no package for {pair[0]}->{pair[1]}")
+        package.install_from_path(available[pair].download())
+
+    return _installed_pairs_in_worker()
+
+@register_backend('argos')
+class OfflineBackend(TranslationBackend):
+    """
+    Local CPU translation with Argos Translate models loaded once into a warm process pool
+
+    Requests reach it with a source language identified locally. When it is the only
+    backend left and the identifier is unsure, it gets the identifier's best guess. In
+    a mixed configuration it only serves as the hedge or fallback for texts whose source
+    was identified; the rest stay with the backends that detect the source themselves.
+    """
+
+    requires_module = 'argostranslate'
+    # Runs on local CPU, so it does not spend the shared network rate limit
+    rate_limited = False
+    # Argos models translate between fixed language pairs and cannot detect the source
+    requires_source = True
+
+    def __init__(self, executor=None, workers=2, threads_per_worker=2, package_dir=None,
+                 auto_install=True, preload_pairs=(), **options):
+        """
+        Args:
+            executor: Unused, inference runs in the process pool
+            workers (int): Worker processes, each holding its own copy of the loaded models
+            threads_per_worker (int): CPU threads CTranslate2 may use inside each worker
+            package_dir (str): Directory holding installed Argos packages
+            auto_install (bool): Download missing language pairs on first use
+            preload_pairs (iterable): (source, target) pairs to load while warming up
+        """
+        super().__init__(executor=executor, **options)
+        self._workers = workers
+        self._auto_install = auto_install
+        self._packages_version = 0
+        self._install_locks = {}
+
+        # Fork the workers now, while the bot is still starting and has no other threads running
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(package_dir, threads_per_worker)
+        )
+        warm_ups = [self._pool.submit(_warm_up, list(preload_pairs)) for _ in range(workers)]
+        for future in warm_ups:
+            future.result()
+        self._installed_pairs = set(self._pool.submit(_installed_pairs_in_worker).result())
+        logger.info(f"Offline translation pool ready: {workers} workers, {len(self._installed_pairs)} installed language pairs")
+
+    def _supports_pair(self, source_language, target_language):
+        """Check whether installed packages cover a pair directly or through English"""
+        pairs = self._installed_pairs
+        return (source_language, target_language) in pairs or (
+            (source_language, 'en') in pairs and ('en', target_language) in pairs
+        )
+
+    async def _ensure_pair(self, source_language, target_language):
+        """Install the packages for a language pair on first use"""
+        if self._supports_pair(source_language, target_language):
+            return
+
+        if not self._auto_install:
+            raise ValueError(f"Unsupported language pair {source_language}->{target_language}: not installed")
+
+        key = (source_language, target_language)
+        lock = self._install_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if self._supports_pair(source_language, target_language):
+                return
+
+            logger.info(f"Installing offline translation packages for {source_language}->{target_language}")
+            loop = asyncio.get_running_loop()
+            installed = await loop.run_in_executor(
+                self._pool, _install_pair_in_worker, source_language, target_language
+            )
+            self._installed_pairs = set(installed)
+            # Tell every worker to reload its language list on its next request
+            self._packages_version += 1
+
+    async def translate(self, text, target_language, source_language='auto'):
+        if source_language == 'auto':
+            raise ValueError("Unsupported request: offline translation needs an explicit source language")
+
+        if source_language == target_language:
+            return text, source_language
+
+        await self._ensure_pair(source_language, target_language)
+
+        loop = asyncio.get_running_loop()
+        translated_text = await loop.run_in_executor(
+            self._pool, _translate_in_worker, text, source_language, target_language, self._packages_version
+        )
+        return translated_text, source_language
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['workers'] = self._workers
+        stats['installed_pairs'] = len(self._installed_pairs)
+        return stats
+
+    async def close(self):
+        """Shut down the worker processes"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class TokenBucketLimiter:
+    """Asyncio token bucket limiter with a burst allowance and a cap on concurrent in-flight calls"""
+
+    def __init__(self, rate, burst=1, max_concurrency=None):
+        """
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            burst (int): Maximum number of tokens that can accumulate
+            max_concurrency (int): Maximum calls in flight at once, or None for no cap
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._max_concurrency = max_concurrency
+
+        # asyncio.Lock and asyncio.Semaphore wake their waiters in FIFO order,
+        # so callers are released in the order they arrived
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        self._waiting = 0
+        self._in_flight = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+
+    def _refill(self):
+        """Add the tokens earned since the last refill"""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for a concurrency slot and a token"""
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            if self._semaphore:
+                await self._semaphore.acquire()
+
+            try:
+                async with self._lock:
+                    self._refill()
+                    if self._tokens < 1:
+                        delay = (1 - self._tokens) / self._rate
+                        logger.info(f"Rate limiting: waiting {delay:.2f}s for a token")
+                        await asyncio.sleep(delay)
+                        self._refill()
+                    self._tokens -= 1
+            except BaseException:
+                if self._semaphore:
+                    self._semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        self._acquired += 1
+        self._total_wait += time.monotonic() - started
+
+    def release(self):
+        """Give back the concurrency slot taken by acquire()"""
+        self._in_flight -= 1
+        if self._semaphore:
+            self._semaphore.release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def has_spare_capacity(self, reserve=1):
+        """
+        Check whether a call could start now while leaving room for others
+
+        Args:
+            reserve (int): Tokens that must remain after the call
+
+        Returns:
+            bool: True if nobody is waiting, a concurrency slot is free and
+                more than reserve tokens are available
+        """
+        self._refill()
+        if self._waiting:
+            return False
+        if self._max_concurrency and self._in_flight >= self._max_concurrency:
+            return False
+        return self._tokens >= 1 + reserve
+
+    def get_stats(self):
+        """
+        Get limiter configuration and counters
+
+        Returns:
+            dict: Limiter statistics
+        """
+        self._refill()
+        return {
+            'rate': self._rate,
+            'burst': self._burst,
+            'max_concurrency': self._max_concurrency,
+            'available_tokens': round(self._tokens, 2),
+            'waiting': self._waiting,
+            'in_flight': self._in_flight,
+            'acquired': self._acquired,
+            'avg_wait': round(self._total_wait / self._acquired, 3) if self._acquired else 0.0,
+        }
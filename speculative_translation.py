@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+class ChannelStats:
+    """Exponentially decaying counts of messages and flag reactions per language in one channel"""
+
+    def __init__(self, half_life):
+        """
+        Args:
+            half_life (float): Seconds after which an observation counts half as much
+        """
+        self._half_life = half_life
+        self._updated = time.monotonic()
+        self.messages = 0.0
+        self.reactions = {}  # language code -> decayed reaction count
+
+    def _decay(self):
+        """Age every count to the current time"""
+        now = time.monotonic()
+        factor = 0.5 ** ((now - self._updated) / self._half_life)
+        self._updated = now
+        if factor < 1.0:
+            self.messages *= factor
+            self.reactions = {code: count * factor for code, count in self.reactions.items() if count * factor >= 0.01}
+
+    def record_message(self):
+        """Count a new message"""
+        self._decay()
+        self.messages += 1
+
+    def record_reaction(self, language_code):
+        """Count a flag reaction for a language"""
+        self._decay()
+        self.reactions[language_code] = self.reactions.get(language_code, 0.0) + 1
+
+    def likely_languages(self, min_reactions, min_share, limit):
+        """
+        Get the languages most likely to be requested for the channel's next message
+
+        Args:
+            min_reactions (float): Decayed reactions the channel needs before it counts as hot
+            min_share (float): Smallest share of the channel's reactions a language needs
+            limit (int): Most languages returned
+
+        Returns:
+            list: Language codes, most requested first
+        """
+        self._decay()
+        total = sum(self.reactions.values())
+        if total < min_reactions:
+            return []
+        ranked = sorted(self.reactions.items(), key=lambda item: item[1], reverse=True)
+        return [code for code, count in ranked[:limit] if count / total >= min_share]
+
+class SpeculativeTranslator:
+    """
+    Pre-translates new messages in hot channels into their most requested languages
+
+    Work runs on one background worker and never competes with flag reactions:
+    messages wait in a bounded queue (dropped when it is full), every translation
+    spends from a per-minute budget, and the service skips it while real requests
+    need the rate limiter. Results land in the translation cache, so a later flag
+    reaction is served without a backend round trip.
+    """
+
+    def __init__(self, translation_service, max_languages=3, min_reactions=5, min_share=0.15,
+                 budget_per_minute=10, half_life=6 * 3600, max_length=500, queue_size=50,
+                 request_deadline=10.0, max_channels=1000):
+        """
+        Args:
+            translation_service (TranslationService): Service whose cache is filled
+            max_languages (int): Most languages each message is pre-translated into
+            min_reactions (float): Decayed flag reactions before a channel is pre-translated
+            min_share (float): Smallest share of a channel's reactions a language needs
+            budget_per_minute (int): Most speculative backend requests per minute
+            half_life (float): Seconds after which channel statistics count half as much
+            max_length (int): Longer messages are not pre-translated
+            queue_size (int): Messages waiting for the worker before new ones are dropped
+            request_deadline (float): Time budget for each speculative translation
+            max_channels (int): Channels tracked before the least recently active is forgotten
+        """
+        self._service = translation_service
+        self._max_languages = max_languages
+        self._min_reactions = min_reactions
+        self._min_share = min_share
+        self._budget_per_minute = budget_per_minute
+        self._half_life = half_life
+        self._max_length = max_length
+        self._request_deadline = request_deadline
+        self._max_channels = max_channels
+
+        self._channels = OrderedDict()  # channel_id -> ChannelStats, least recently active first
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._worker = None
+        self._budget_window = time.monotonic()
+        self._budget_spent = 0
+
+        self._queued = 0
+        self._dropped = 0
+        self._translated = 0
+        self._skipped = 0
+        self._over_budget = 0
+
+    def _channel(self, channel_id):
+        """Get a channel's statistics, creating them and forgetting the least recently active channel if needed"""
+        stats = self._channels.get(channel_id)
+        if stats is None:
+            stats = self._channels[channel_id] = ChannelStats(self._half_life)
+            if len(self._channels) > self._max_channels:
+                self._channels.popitem(last=False)
+        else:
+            self._channels.move_to_end(channel_id)
+        return stats
+
+    def record_reaction(self, channel_id, language_code):
+        """
+        Count a flag reaction towards the channel's language statistics
+
+        Args:
+            channel_id (int): Channel the reacted message is in
+            language_code (str): Requested language code
+        """
+        self._channel(channel_id).record_reaction(language_code)
+
+    def record_message(self, message):
+        """
+        Count a new message and queue it for pre-translation if its channel is hot
+
+        Args:
+            message (discord.Message): The new message
+        """
+        if message.author.bot or not message.content:
+            return
+
+        stats = self._channel(message.channel.id)
+        stats.record_message()
+
+        if len(message.content) > self._max_length:
+            return
+        languages = stats.likely_languages(self._min_reactions, self._min_share, self._max_languages)
+        if not languages:
+            return
+
+        try:
+            self._queue.put_nowait((message.content, languages))
+            self._queued += 1
+        except asyncio.QueueFull:
+            self._dropped += 1
+            return
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    def _has_budget(self):
+        """Check whether this minute's budget has a request left, starting a new minute when due"""
+        now = time.monotonic()
+        if now - self._budget_window >= 60:
+            self._budget_window = now
+            self._budget_spent = 0
+        return self._budget_spent < self._budget_per_minute
+
+    async def _run(self):
+        """Background worker: pre-translate queued messages one language at a time"""
+        while not self._queue.empty():
+            text, languages = self._queue.get_nowait()
+            for language_code in languages:
+                if not self._has_budget():
+                    self._over_budget += 1
+                    continue
+                try:
+                    sent = await self._service.prefetch(text, language_code, deadline=Deadline(self._request_deadline))
+                except Exception as e:
+                    logger.error(f"Speculative translation to {language_code} failed: {e}")
+                    continue
+
+                if sent:
+                    self._budget_spent += 1
+                    self._translated += 1
+                else:
+                    self._skipped += 1
+                # Yield between requests so reaction handlers always run first
+                await asyncio.sleep(0)
+
+    def get_stats(self):
+        """
+        Get pre-translation statistics
+
+        Returns:
+            dict: Tracked channels, queue depth and request counters
+        """
+        return {
+            'channels': len(self._channels),
+            'queue_depth': self._queue.qsize(),
+            'queued': self._queued,
+            'dropped': self._dropped,
+            'translated': self._translated,
+            'skipped': self._skipped,
+            'over_budget': self._over_budget,
+            'budget_per_minute': self._budget_per_minute,
+        }
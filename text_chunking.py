@@ -0,0 +1,130 @@
+import re
+
+# A line break with the blank lines and indentation around it
+_LINE_BREAK = re.compile(r'(\s*\n\s*)')
+# Whitespace after sentence-ending punctuation; CJK full stops need no whitespace
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?…])\s+|(?<=[。！？])\s*')
+_WORD_BREAK = re.compile(r'\s+')
+
+def split_text(text, max_length):
+    """
+    Split text into pieces of at most max_length characters at line, sentence and word boundaries
+
+    Lines are always kept apart so line and paragraph breaks survive translation;
+    only lines longer than max_length are packed into sentence-sized pieces.
+
+    Args:
+        text (str): Text to split
+        max_length (int): Maximum characters per piece
+
+    Returns:
+        list: (piece, separator) tuples; joining piece + separator for every tuple
+            rebuilds the text with its line and paragraph breaks
+    """
+    parts = _LINE_BREAK.split(text.strip())
+    pieces = []
+
+    for index in range(0, len(parts), 2):
+        line = parts[index].strip()
+        if not line:
+            continue
+
+        separator = parts[index + 1] if index + 1 < len(parts) else ''
+        separator = '\n\n' if separator.count('\n') > 1 else '\n' if separator else ''
+
+        line_pieces = _pack(line, max_length, (_SENTENCE_BREAK, _WORD_BREAK))
+        line_pieces[-1] = (line_pieces[-1][0], separator)
+        pieces.extend(line_pieces)
+
+    return pieces
+
+def split_sentences(text):
+    """
+    Split text into its sentences
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: (sentence, separator) tuples; joining sentence + separator for every
+            tuple rebuilds the text
+    """
+    sentences = []
+    for line, line_separator in split_text(text, len(text)):
+        line_sentences = [(sentence, separator) for sentence, separator in _split_at(line, _SENTENCE_BREAK) if sentence]
+        line_sentences[-1] = (line_sentences[-1][0], line_separator)
+        sentences.extend(line_sentences)
+    return sentences
+
+def _split_at(text, pattern):
+    """Split text at every match of a break pattern into (segment, separator) tuples, normalising the separator"""
+    segments = []
+    start = 0
+    for match in pattern.finditer(text):
+        segments.append((text[start:match.start()], ' ' if match.group() else ''))
+        start = match.end()
+    segments.append((text[start:], ''))
+    return segments
+
+def _pack(text, max_length, breaks):
+    """Greedily pack the segments between one kind of break into pieces, splitting oversized segments further"""
+    if len(text) <= max_length:
+        return [(text, '')]
+
+    if not breaks:
+        # A single unbroken run longer than a piece, e.g. a long URL
+        return [(text[start:start + max_length], '') for start in range(0, len(text), max_length)]
+
+    pattern, finer_breaks = breaks[0], breaks[1:]
+    segments = _split_at(text, pattern)
+
+    pieces = []
+    current, current_separator = '', ''
+    for segment, separator in segments:
+        if not segment:
+            continue
+
+        if len(segment) > max_length:
+            if current:
+                pieces.append((current, current_separator))
+                current = ''
+            finer = _pack(segment, max_length, finer_breaks)
+            finer[-1] = (finer[-1][0], separator)
+            pieces.extend(finer)
+            continue
+
+        if current and len(current) + len(current_separator) + len(segment) > max_length:
+            pieces.append((current, current_separator))
+            current = ''
+
+        current = current + current_separator + segment if current else segment
+        current_separator = separator
+
+    if current:
+        pieces.append((current, current_separator))
+
+    return pieces
+
+def paginate_text(text, page_length):
+    """
+    Split text into pages of at most page_length characters, breaking between lines where possible
+
+    Args:
+        text (str): Text to paginate
+        page_length (int): Maximum characters per page
+
+    Returns:
+        list: Page strings
+    """
+    pages = []
+    current = ''
+    for piece, separator in split_text(text, page_length):
+        if current and len(current) + len(piece) > page_length:
+            pages.append(current.rstrip())
+            current = ''
+        current += piece + separator
+
+    if current.strip():
+        pages.append(current.rstrip())
+
+    return pages
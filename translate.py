@@ -1,183 +1,890 @@
 import asyncio
+import contextlib
 import logging
-import time
 import random
+import time
+from backends import create_backend
+from circuit_breaker import CircuitBreaker
+from config import TRANSLATION_CONFIG, FEATURE_FLAGS
+from language_detection import LanguageIdentifier
+from language_registry import LanguageRegistry, load_backend_languages
+from languages import get_supported_languages
+from markup import has_translatable_text, protect_markup, restore_markup
+from near_duplicate import NearDuplicateIndex
+import offline_backend  # noqa: F401 - registers the 'argos' backend
+from rate_limiter import TokenBucketLimiter
+from text_chunking import split_sentences, split_text
+from translation_batcher import BATCH_DELIMITER, TranslationBatcher
+from translation_cache import TranslationCache
+from translation_executor import TranslationExecutor
+from translation_types import (
+    DeadlineExceededError,
+    EmptyResultError,
+    QuotaExceededError,
+    RateLimitedError,
+    ServiceUnavailableError,
+    TranslationError,
+    TranslationResult,
+    TranslationTimeoutError,
+    UnsupportedLanguageError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Missing segments are sent one per line; sanitized segments never contain newlines
+SEGMENT_DELIMITER = '\n'
+
 class TranslationService:
-    """Service for handling message translations using deep-translator with improved reliability"""
+    """Service for handling message translations through pluggable backends with improved reliability"""
     
     def __init__(self):
-        self._rate_limit_delay = 1.0  # Reduced delay since deep-translator is more reliable
-        self._last_request_time = 0
+        # Shared limiter for every backend call: sustained rate, burst and in-flight cap
+        self._limiter = TokenBucketLimiter(
+            rate=TRANSLATION_CONFIG['rate_limit_per_second'],
+            burst=TRANSLATION_CONFIG['rate_limit_burst'],
+            max_concurrency=TRANSLATION_CONFIG['max_concurrent_requests']
+        )
+        # Dedicated pool for blocking backend calls, separate from the loop's default executor
+        self._executor = TranslationExecutor(
+            max_workers=TRANSLATION_CONFIG['executor_max_workers'],
+            name='echolang-translate'
+        )
+        # Configured backends in priority order: the first is primary, the second takes hedged requests
+        self._backends = self._create_backends(TRANSLATION_CONFIG['translation_backends'])
+        self._breakers = {
+            backend.name: CircuitBreaker(
+                backend.name,
+                failure_threshold=TRANSLATION_CONFIG['breaker_failure_threshold'],
+                recovery_timeout=TRANSLATION_CONFIG['breaker_recovery_timeout']
+            )
+            for backend in self._backends
+        }
+        self._hedging_enabled = FEATURE_FLAGS.get('enable_hedged_requests', True)
+        self._hedge_default_delay = TRANSLATION_CONFIG['hedge_default_delay']
+        self._hedge_min_delay = TRANSLATION_CONFIG['hedge_min_delay']
+        self._hedged_requests = 0
+        self._hedge_wins = 0
+        self._deadline_exceeded = 0
         self._retry_attempts = 3
         self._backoff_multiplier = 1.5
-        self._max_text_length = 1000
+        self._max_text_length = TRANSLATION_CONFIG['max_text_length']
+        self._chunk_max_length = TRANSLATION_CONFIG['chunk_max_length']
+        self._chunked_translations = 0
+        self._detect_api_key = TRANSLATION_CONFIG['detect_language_api_key']
+        self._language_names = get_supported_languages()
+        # Backend language table, bundled snapshot until load_supported_languages() runs at startup
+        self._languages = LanguageRegistry()
+        self._same_language_skips = 0
+        self._prefetched = 0
+        
+        # Identify the source locally so same-language requests never reach a backend
+        self._identifier = None
+        if FEATURE_FLAGS.get('enable_language_detection', True):
+            self._identifier = LanguageIdentifier(
+                min_confidence=TRANSLATION_CONFIG['local_detection_min_confidence']
+            )
+        self._inflight = {}  # (text, target_language) -> shared translation task
+        self._inflight_waiters = {}  # shared translation task -> callers still waiting on it
+        self._coalesced_requests = 0
+        
+        # Remember successful translations across reactions and restarts
+        self._cache = None
+        if FEATURE_FLAGS.get('enable_translation_cache', True):
+            self._cache = TranslationCache(
+                max_entries=TRANSLATION_CONFIG['cache_max_entries'],
+                ttl=TRANSLATION_CONFIG['cache_ttl'],
+                db_path=TRANSLATION_CONFIG['cache_db_path'],
+                disk_ttl=TRANSLATION_CONFIG['cache_disk_ttl'],
+                write_delay=TRANSLATION_CONFIG['cache_write_delay']
+            )
+        
+        # Sentence-level translation memory in its own cache namespace, so repeated
+        # boilerplate only sends the sentences that changed
+        self._segment_memory = self._cache is not None and FEATURE_FLAGS.get('enable_segment_memory', True)
+        # Cached translations are keyed by the backend that produced them; any configured backend's are accepted
+        self._cache_backends = [backend.name for backend in self._backends]
+        self._segment_namespaces = [self._segment_namespace(name) for name in self._cache_backends]
+        self._segment_hits = 0
+        self._segment_misses = 0
+        self._segment_misaligned = 0
+        
+        # Reuse translations of texts with the same words (casing, punctuation, spam waves)
+        self._near_duplicates = None
+        if FEATURE_FLAGS.get('enable_near_duplicate_lookup', True):
+            self._near_duplicates = NearDuplicateIndex(max_entries=TRANSLATION_CONFIG['near_duplicate_max_entries'])
+        
+        # Pack short texts for the same language pair into one backend request
+        self._batcher = None
+        self._batch_max_text_length = TRANSLATION_CONFIG['batch_max_text_length']
+        if TRANSLATION_CONFIG['batch_window_ms'] > 0:
+            self._batcher = TranslationBatcher(
+                send_request=lambda text, target, source: self._request(text, target, source, 0),
+                window=TRANSLATION_CONFIG['batch_window_ms'] / 1000,
+                max_items=TRANSLATION_CONFIG['batch_max_items'],
+                max_chars=TRANSLATION_CONFIG['batch_max_chars']
+            )
     
-    def _get_translator(self, target_language):
-        """Get a translator instance for the target language"""
-        try:
-            from deep_translator import GoogleTranslator
-            
-            # Create translator for specific language pair
-            return GoogleTranslator(source='auto', target=target_language)
-        except Exception as e:
-            logger.error(f"Failed to create translator instance: {e}")
-            return None
+    def _create_backends(self, names):
+        """Create the configured backends, falling back to deep-translator if none can be used"""
+        backends = []
+        for name in names:
+            options = TRANSLATION_CONFIG['backend_options'].get(name, {})
+            backend = create_backend(name, self._executor, **options)
+            if backend:
+                backends.append(backend)
+        
+        if not backends:
+            logger.warning("No configured translation backend is available, using deep-translator")
+            backends.append(create_backend('deep-translator', self._executor))
+        
+        logger.info(f"Translation backends: {', '.join(backend.name for backend in backends)}")
+        return backends
     
-    async def translate(self, text, target_language):
+    async def translate(self, text, target_language, source_language='auto', deadline=None):
         """
         Translate text to target language with retry logic and better error handling
         
         Args:
             text (str): Text to translate
             target_language (str): Target language code (e.g., 'es', 'fr', 'ja')
+            source_language (str): Source language code, or 'auto' to identify it locally
+                and fall back to the backend's detection
+            deadline (Deadline): Time budget that retries, hedging and rate limit waits
+                must fit in, or None for no limit
             
         Returns:
-            str: Translated text or descriptive error message
+            TranslationResult: The translation, or a result with a notice when the text
+                is empty, only markup, or already in the target language
+            
+        Raises:
+            TranslationError: The translation failed; the subclass tells why
         """
+        started = time.monotonic()
         if not text or not text.strip():
-            return "[Empty message]"
+            return TranslationResult('', target_language, notice="Empty message")
+        
+        # Reject languages the backend cannot produce before anything is queued or retried
+        if not self._languages.is_supported(target_language):
+            logger.info(f"Target language {target_language} is not supported, rejecting request")
+            raise UnsupportedLanguageError(target_language, detail=f"{target_language} is not in the backend's language table")
+        
+        # Mentions, custom emoji, URLs and code never go to the backend
+        text, spans = protect_markup(text.strip())
+        if not has_translatable_text(text):
+            logger.info(f"Message to {target_language} has no translatable text, skipping translation")
+            return TranslationResult(restore_markup(text, spans), target_language, notice="Nothing to translate")
+        
+        try:
+            result = await self._translate_text(text, target_language, source_language, deadline)
+        except DeadlineExceededError:
+            self._deadline_exceeded += 1
+            raise
+        return result.replace(text=restore_markup(result.text, spans), latency=time.monotonic() - started)
+    
+    async def _translate_text(self, text, target_language, source_language='auto', deadline=None):
+        """
+        Translate markup-protected text, chunking it when long
+        
+        Args:
+            text (str): Text with markup replaced by placeholders
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+            deadline (Deadline): Time budget, or None
+            
+        Returns:
+            TranslationResult: Translated text with placeholders
+            
+        Raises:
+            TranslationError: The translation failed
+        """
+        if len(text) > self._chunk_max_length:
+            return await self._translate_chunked(text, target_language, source_language, deadline)
+        
+        text = self._prepare_text(text)
+        
+        if source_language == 'auto' and self._identifier:
+            source_language = self._identifier.detect(text) or 'auto'
+        
+        if self._is_same_language(source_language, target_language):
+            self._same_language_skips += 1
+            logger.info(f"Text is already in {target_language}, skipping translation")
+            return self._already_in_result(text, target_language, source_language)
+        
+        if self._cache:
+            cached = await self._cache.get(text, target_language, self._cache_backends)
+            if cached is not None:
+                logger.info(f"Translation cache hit for {target_language}")
+                return TranslationResult(
+                    cached, target_language,
+                    source_language=None if source_language == 'auto' else source_language,
+                    cache_hit=True
+                )
+        
+        if self._near_duplicates:
+            translation = self._near_duplicates.find(text, target_language)
+            if translation is not None:
+                logger.info(f"Near-duplicate translation hit for {target_language} (same words)")
+                return TranslationResult(
+                    translation, target_language,
+                    source_language=None if source_language == 'auto' else source_language,
+                    cache_hit=True
+                )
+        
+        # Coalesce concurrent requests for the same text and language into one backend call
+        key = (text, target_language)
+        task = self._inflight.get(key)
+        if task is None:
+            # The shared request has no deadline of its own, so a caller with a short budget does not
+            # cut it short for the others; each caller bounds its own wait, and the request is
+            # cancelled once every caller has given up
+            task = asyncio.create_task(self._translate_uncached(text, target_language, source_language))
+            self._inflight[key] = task
+            self._inflight_waiters[task] = 0
+            task.add_done_callback(lambda done, key=key: self._finish_inflight(key, done))
+        else:
+            self._coalesced_requests += 1
+            logger.info(f"Joining in-flight translation to {target_language}")
+        
+        # Shield so one cancelled or timed out waiter does not cancel the shared request for everyone else
+        self._inflight_waiters[task] += 1
+        try:
+            return await self._within_deadline(asyncio.shield(task), deadline, target_language)
+        except DeadlineExceededError:
+            stale = await self._circuit_open_fallback(text, target_language, source_language)
+            if stale is None:
+                raise
+            return stale
+        finally:
+            self._leave_inflight(key, task)
+    
+    async def translate_many(self, text, target_languages, deadline=None):
+        """
+        Translate one text into several languages concurrently under the shared rate limiter
+        
+        The source language is detected once up front (when more than one target
+        still needs the backend) and passed explicitly to every per-target request.
+        
+        Args:
+            text (str): Text to translate
+            target_languages (list): Target language codes
+            deadline (Deadline): Time budget shared by every language, or None
+            
+        Returns:
+            dict: Target language code -> TranslationResult, or the TranslationError
+                that language failed with
+        """
+        targets = list(dict.fromkeys(target_languages))
+        if not targets:
+            return {}
+        
+        source_language = 'auto'
+        if text and text.strip() and len(targets) > 1:
+            protected, _ = protect_markup(text.strip())
+            prepared = self._prepare_text(protected)
+            uncached = [
+                target for target in targets
+                if self.is_supported_language(target)
+                and not (self._cache and await self._cache.contains(prepared, target, self._cache_backends))
+            ]
+            if len(uncached) > 1:
+                source_language = await self.detect_language(protected) or 'auto'
+                logger.info(f"Detected source {source_language} for {len(uncached)} target languages")
+        
+        results = await asyncio.gather(
+            *(self.translate(text, target, source_language, deadline) for target in targets),
+            return_exceptions=True
+        )
+        
+        translations = {}
+        for target, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Translation to {target} failed: {result}")
+                if not isinstance(result, TranslationError):
+                    result = TranslationError(target, detail=str(result))
+            translations[target] = result
+        return translations
+    
+    async def is_cached(self, text, target_language):
+        """
+        Check whether a translation can be answered from the cache without a backend request
+        
+        Args:
+            text (str): Text to translate
+            target_language (str): Target language code
+            
+        Returns:
+            bool: True if a non-expired translation of the whole text is cached
+        """
+        if not self._cache or not text or not text.strip():
+            return False
         
-        # Sanitize and limit text length
+        protected, _ = protect_markup(text.strip())
+        if len(protected) > self._chunk_max_length:
+            return False
+        return await self._cache.contains(self._prepare_text(protected), target_language, self._cache_backends)
+    
+    async def prefetch(self, text, target_language, deadline=None):
+        """
+        Speculatively translate text into the cache while the backends have spare capacity
+        
+        Nothing is sent when real requests are waiting for the rate limiter, when the
+        translation is already cached, or when the text needs no translation.
+        
+        Args:
+            text (str): Text to translate
+            target_language (str): Target language code
+            deadline (Deadline): Time budget for the request, or None
+            
+        Returns:
+            bool: True if a backend request was made
+        """
+        if not self._cache or not text or not self.is_supported_language(target_language):
+            return False
+        
+        protected, _ = protect_markup(text.strip())
+        if not has_translatable_text(protected) or len(protected) > self._chunk_max_length:
+            return False
+        
+        prepared = self._prepare_text(protected)
+        if await self._cache.contains(prepared, target_language, self._cache_backends):
+            return False
+        if self._identifier and self._is_same_language(self._identifier.detect(prepared) or 'auto', target_language):
+            return False
+        
+        # Leave tokens for flag reactions; speculative work only uses what they do not
+        if not self._limiter.has_spare_capacity(reserve=1):
+            return False
+        
+        try:
+            result = await self.translate(text, target_language, deadline=deadline)
+        except TranslationError as e:
+            logger.info(f"Speculative translation to {target_language} failed: {e}")
+            return True
+        
+        # A cache hit here (e.g. a text with the same words as an earlier one) sent nothing
+        if result.cache_hit:
+            return False
+        self._prefetched += 1
+        return True
+    
+    async def _translate_chunked(self, text, target_language, source_language='auto', deadline=None):
+        """
+        Translate a long text as line- and sentence-aligned chunks sent concurrently
+        
+        Each chunk goes through _translate_text() and so shares the cache, in-flight
+        coalescing, batching and rate limiter with every other request.
+        
+        Args:
+            text (str): Markup-protected text longer than one chunk
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+            deadline (Deadline): Time budget shared by every chunk, or None
+            
+        Returns:
+            TranslationResult: Translated chunks reassembled in their original order
+            
+        Raises:
+            TranslationError: The first chunk failure, if any chunk failed
+        """
         text = text.strip()
         if len(text) > self._max_text_length:
             text = text[:self._max_text_length] + "..."
+        
+        # Identify the source once from the whole text rather than per chunk
+        if source_language == 'auto' and self._identifier:
+            source_language = self._identifier.detect(text) or 'auto'
+        
+        if self._is_same_language(source_language, target_language):
+            self._same_language_skips += 1
+            return self._already_in_result(text, target_language, source_language)
+        
+        chunks = split_text(text, self._chunk_max_length)
+        self._chunked_translations += 1
+        logger.info(f"Translating {len(text)} characters to {target_language} as {len(chunks)} chunks")
+        
+        results = await asyncio.gather(
+            *(self._translate_text(chunk, target_language, source_language, deadline) for chunk, _ in chunks),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Chunk translation to {target_language} failed: {result}")
+                raise result
+        
+        # A chunk (e.g. a quoted line) already in the target language keeps its own text
+        translated = ''.join(result.text + separator for result, (_, separator) in zip(results, chunks))
+        translated_results = [result for result in results if result.translated]
+        return TranslationResult(
+            translated, target_language,
+            source_language=None if source_language == 'auto' else source_language,
+            backend=next((result.backend for result in translated_results if result.backend), None),
+            cache_hit=all(result.cache_hit for result in translated_results)
+        )
+    
+    def _is_same_language(self, source_language, target_language):
+        """Check whether a known source language matches the target, ignoring regional variants"""
+        if source_language == 'auto':
+            return False
+        return source_language.split('-')[0].lower() == target_language.split('-')[0].lower()
+    
+    def _already_in_result(self, text, target_language, source_language):
+        """Build the result for text that is already in the target language"""
+        language_name = self._language_names.get(target_language, target_language.upper())
+        return TranslationResult(text, target_language, source_language=source_language,
+                                 notice=f"Already in {language_name}")
+    
+    def _leave_inflight(self, key, task):
+        """Stop waiting on an in-flight translation, cancelling it if nobody else still wants it"""
+        waiters = self._inflight_waiters.get(task)
+        if waiters is None:
+            return
+        
+        self._inflight_waiters[task] = waiters - 1
+        if waiters == 1 and not task.done():
+            logger.info(f"Every caller gave up on translation to {key[1]}, cancelling it")
+            # Forget it now so a new caller starts a fresh request instead of joining a cancelled one
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            task.cancel()
+    
+    def _finish_inflight(self, key, task):
+        """Forget a finished in-flight translation"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._inflight_waiters.pop(task, None)
+        
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _translate_uncached(self, text, target_language, source_language='auto', deadline=None):
+        """
+        Translate sanitized text through the backend with retries, storing successes in the cache
+        
+        Args:
+            text (str): Sanitized text to translate
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+            deadline (Deadline): Time budget, or None
             
-        # Remove potentially problematic characters
-        text = self._sanitize_text(text)
+        Returns:
+            TranslationResult: The translation, possibly a stale cached one while every
+                backend is unavailable or when the deadline runs out
+            
+        Raises:
+            TranslationError: The translation failed
+        """
+        try:
+            if self._segment_memory:
+                result = await self._translate_segments(text, target_language, source_language, deadline)
+                if result is not None:
+                    self._remember(text, target_language, result)
+                    return result
+            
+            result = await self._translate_with_retries(text, target_language, source_language, deadline)
+        except (ServiceUnavailableError, DeadlineExceededError):
+            stale = await self._circuit_open_fallback(text, target_language, source_language)
+            if stale is None:
+                raise
+            return stale
+        
+        self._remember(text, target_language, result)
+        return result
+    
+    @staticmethod
+    def _segment_namespace(backend_name):
+        """Cache namespace for one backend's sentence-level translations"""
+        return f"{backend_name}-segment"
+    
+    def _remember(self, text, target_language, result):
+        """Store a fresh translation in the cache and the near-duplicate index"""
+        # A stitch of cached segments has no single producing backend; its segments are already cached
+        if self._cache and result.backend:
+            self._cache.set(text, target_language, result.backend, result.text)
+        if self._near_duplicates:
+            self._near_duplicates.add(text, target_language, result.text)
+    
+    async def _translate_segments(self, text, target_language, source_language='auto', deadline=None):
+        """
+        Translate text sentence by sentence through the segment translation memory
+        
+        Sentences already in the memory are reused; only the missing ones go to the
+        backend, one per line in a single request, and the result is stitched back
+        together in the original order.
+        
+        Args:
+            text (str): Sanitized text to translate
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+            deadline (Deadline): Time budget, or None
+            
+        Returns:
+            TranslationResult: Stitched translation, or None if the text should be
+                translated as a whole instead
+            
+        Raises:
+            TranslationError: The request for the missing segments failed
+        """
+        segments = split_sentences(text)
+        # Single sentences gain nothing, and stale whole-text fallbacks need the whole-text path
+        if len(segments) < 2 or self._all_circuits_open():
+            return None
         
+        translations = await self._cache.get_many([segment for segment, _ in segments], target_language, self._segment_namespaces)
+        missing = [index for index, translation in enumerate(translations) if translation is None]
+        self._segment_hits += len(segments) - len(missing)
+        self._segment_misses += len(missing)
+        
+        result = TranslationResult(
+            '', target_language,
+            source_language=None if source_language == 'auto' else source_language,
+            cache_hit=True
+        )
+        if missing:
+            request_text = SEGMENT_DELIMITER.join(segments[index][0] for index in missing)
+            result = await self._translate_with_retries(request_text, target_language, source_language, deadline)
+            
+            parts = [part.strip() for part in result.text.split(SEGMENT_DELIMITER)]
+            if len(parts) != len(missing) or not all(parts):
+                self._segment_misaligned += 1
+                logger.warning(f"{len(missing)} segments to {target_language} came back as {len(parts)} lines, translating as a whole")
+                return None
+            
+            for index, part in zip(missing, parts):
+                translations[index] = part
+                self._cache.set(segments[index][0], target_language, self._segment_namespace(result.backend), part)
+        else:
+            logger.info(f"All {len(segments)} segments to {target_language} found in translation memory")
+        
+        stitched = ''.join(translation + separator for translation, (_, separator) in zip(translations, segments))
+        return result.replace(text=stitched.strip())
+    
+    async def _translate_with_retries(self, text, target_language, source_language='auto', deadline=None):
+        """
+        Send text to the backends, retrying with backoff on retryable failures
+        
+        Args:
+            text (str): Text to translate
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+            deadline (Deadline): Time budget every attempt and backoff must fit in, or None
+            
+        Returns:
+            TranslationResult: The fresh translation
+            
+        Raises:
+            TranslationError: The last failure, raised at once if it is not retryable
+                or no time is left for another attempt
+        """
         for attempt in range(self._retry_attempts):
+            # Fail fast instead of retrying while every backend's circuit is open
+            if self._all_circuits_open():
+                raise ServiceUnavailableError(target_language, detail="every circuit breaker is open")
+            
+            # Wait before retry with exponential backoff
+            if attempt:
+                delay = self._backoff_multiplier ** (attempt - 1) + random.uniform(0.1, 0.5)
+                if deadline and delay >= deadline.remaining:
+                    logger.info(f"No time left to retry translation to {target_language}, giving up")
+                    raise error
+                await asyncio.sleep(delay)
+            
             try:
-                # Rate limiting with jitter
-                await self._apply_rate_limit(attempt)
+                # First attempt for short texts rides along with other messages to the same language
+                result = None
+                if (attempt == 0 and self._batcher and len(text) <= self._batch_max_text_length
+                        and BATCH_DELIMITER not in text):
+                    result = await self._within_deadline(
+                        self._batcher.submit(text, target_language, source_language), deadline, target_language
+                    )
                 
-                # Perform translation in thread to avoid blocking
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self._translate_sync, text, target_language, attempt
+                if result is None:
+                    result = await self._request(text, target_language, source_language, attempt, deadline)
+                return result
+            
+            except TranslationError as e:
+                error = e
+            except Exception as e:
+                error = self._classify_error(e, target_language)
+            
+            logger.warning(f"Translation attempt {attempt + 1} to {target_language} failed: {error} ({error.detail})")
+            if not error.retryable:
+                logger.info(f"Not retrying {error.category} failure for {target_language}")
+                raise error
+        
+        raise error
+    
+    async def _request(self, text, target_language, source_language, attempt, deadline=None):
+        """
+        Send one request to the backends under the shared rate limiter
+        
+        If the primary backend has not answered within its p95 latency, a duplicate
+        request goes to the secondary backend and whichever answers first wins.
+        
+        Returns:
+            TranslationResult: The first successful translation
+            
+        Raises:
+            TranslationError: No backend could take the request, or every backend tried failed
+        """
+        primary = self._route(source_language)
+        if primary is None and source_language == 'auto' and self._identifier:
+            # Only backends that need a known source (e.g. offline-only) can take it: give them the
+            # local identifier's best guess, even one too uncertain to skip translation on
+            guess, _ = self._identifier.identify(text)
+            if guess and self.is_supported_language(guess):
+                primary = self._route(guess)
+                if primary is not None:
+                    logger.info(f"No available backend detects the source, sending {primary.name} the best guess {guess}")
+                    source_language = guess
+        if primary is None:
+            logger.warning(f"No translation backend available for {source_language} -> {target_language}, failing fast")
+            raise ServiceUnavailableError(target_language, detail=f"no backend can take {source_language} -> {target_language}")
+        
+        async with self._rate_limited(primary, deadline, target_language):
+            secondary = self._hedge_backend(primary, source_language)
+            if secondary is None:
+                return await self._within_deadline(
+                    self._call_backend(primary, text, target_language, attempt, source_language), deadline, target_language
                 )
+            
+            primary_task = asyncio.create_task(
+                self._call_backend(primary, text, target_language, attempt, source_language)
+            )
+            pending = {primary_task}
+            try:
+                hedge_delay = self._hedge_delay(primary)
+                done, pending = await asyncio.wait(pending, timeout=deadline.cap(hedge_delay) if deadline else hedge_delay)
+                if done:
+                    return primary_task.result()
+                if deadline and deadline.expired:
+                    raise self._deadline_error(target_language)
                 
-                self._last_request_time = time.time()
+                # A hedge is an extra request: it only goes out on a token nobody is waiting for
+                if secondary.rate_limited and not self._limiter.has_spare_capacity(reserve=0):
+                    logger.info(f"{primary.name} is slow but the rate limit has no spare capacity, not hedging")
+                    return await self._within_deadline(primary_task, deadline, target_language)
                 
-                # Validate translation result
-                if result and not self._is_error_result(result):
-                    return result
-                else:
-                    logger.warning(f"Translation attempt {attempt + 1} returned invalid result: {result}")
-                    if attempt == self._retry_attempts - 1:
-                        return f"[Translation failed - {target_language.upper()}]"
-                    
-            except Exception as e:
-                logger.error(f"Translation attempt {attempt + 1} failed: {e}")
-                if attempt == self._retry_attempts - 1:
-                    return f"[Translation error - {target_language.upper()}]"
+                self._hedged_requests += 1
+                logger.info(f"{primary.name} is slow, hedging translation to {target_language} on {secondary.name}")
+                secondary_task = asyncio.create_task(
+                    self._call_hedge(secondary, text, target_language, attempt, source_language)
+                )
+                pending.add(secondary_task)
                 
-                # Wait before retry with exponential backoff
-                await asyncio.sleep(self._backoff_multiplier ** attempt + random.uniform(0.1, 0.5))
+                # Take the first successful answer; an error only counts once both have failed
+                error = None
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, timeout=deadline.remaining if deadline else None, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        raise self._deadline_error(target_language)
+                    for task in done:
+                        if task.exception() is not None:
+                            error = task.exception()
+                            continue
+                        if task is secondary_task:
+                            self._hedge_wins += 1
+                        return task.result()
+                raise error
+            finally:
+                for task in pending:
+                    task.cancel()
+    
+    async def _call_hedge(self, backend, text, target_language, attempt, source_language):
+        """Send the duplicate request of a hedge under its own rate limiter slot"""
+        async with self._rate_limited(backend, None, target_language):
+            return await self._call_backend(backend, text, target_language, attempt, source_language)
+    
+    @contextlib.asynccontextmanager
+    async def _rate_limited(self, backend, deadline, target_language):
+        """Hold a slot of the shared rate limiter for a backend call, waiting no longer than the deadline"""
+        # Local backends don't spend the shared network rate limit
+        if not backend.rate_limited:
+            yield
+            return
         
-        return f"[Translation unavailable - {target_language.upper()}]"
+        await self._within_deadline(self._limiter.acquire(), deadline, target_language)
+        try:
+            yield
+        finally:
+            self._limiter.release()
     
-    def _sanitize_text(self, text):
-        """Remove or replace problematic characters that might cause translation issues"""
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
+    async def _within_deadline(self, awaitable, deadline, target_language):
+        """
+        Await something, raising DeadlineExceededError if the deadline passes first
         
-        # Remove some problematic Unicode characters that might cause issues
-        problematic_chars = ['\u200b', '\u200c', '\u200d', '\ufeff']
-        for char in problematic_chars:
-            text = text.replace(char, '')
+        Args:
+            awaitable: Coroutine or future to wait for; cancelled when the deadline passes
+            deadline (Deadline): Time budget, or None to wait as long as it takes
+            target_language (str): Target language code, for the error
+        """
+        if deadline is None:
+            return await awaitable
         
-        return text
+        try:
+            return await deadline.wait_for(awaitable)
+        except asyncio.TimeoutError:
+            raise self._deadline_error(target_language) from None
     
-    def _is_error_result(self, result):
-        """Check if the translation result indicates an error"""
-        if not result:
-            return True
-        
-        error_indicators = [
-            'Translation unavailable',
-            'Translation failed',
-            'Translation error',
-            '[Translation',
-            'Error:'
-        ]
+    def _deadline_error(self, target_language):
+        """Build the error for a request whose deadline passed"""
+        logger.warning(f"Translation to {target_language} ran out of time")
+        return DeadlineExceededError(target_language, detail="deadline exceeded")
+    
+    def _hedge_backend(self, primary, source_language):
+        """Pick the backend for hedged requests: the next healthy, capable one after the primary"""
+        if not self._hedging_enabled:
+            return None
         
-        return any(indicator in result for indicator in error_indicators)
+        following = self._backends[self._backends.index(primary) + 1:]
+        return next(
+            (backend for backend in following
+             if self._can_handle(backend, source_language)
+             and self._breakers[backend.name].state == CircuitBreaker.CLOSED),
+            None
+        )
+    
+    def _route(self, source_language):
+        """Pick the first capable backend whose circuit breaker lets the request through, or None"""
+        return next(
+            (backend for backend in self._backends
+             if self._can_handle(backend, source_language) and self._breakers[backend.name].allow_request()),
+            None
+        )
     
-    async def _apply_rate_limit(self, attempt):
-        """Apply rate limiting with backoff for retries"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+    def _can_handle(self, backend, source_language):
+        """Check whether a backend can take a request with this source language"""
+        return source_language != 'auto' or not backend.requires_source
+    
+    def _all_circuits_open(self):
+        """Check whether every backend's circuit breaker is rejecting requests"""
+        return all(breaker.state == CircuitBreaker.OPEN for breaker in self._breakers.values())
+    
+    async def _circuit_open_fallback(self, text, target_language, source_language='auto'):
+        """
+        Find an expired cached translation to serve while no backend can be reached
         
-        # Base delay plus additional delay for retries
-        required_delay = self._rate_limit_delay + (attempt * 0.3)
+        Returns:
+            TranslationResult: The stale translation, or None if there is none
+        """
+        if self._cache:
+            stale = await self._cache.get_stale(text, target_language, self._cache_backends)
+            if stale is not None:
+                logger.info(f"All backends unavailable, serving stale cached translation for {target_language}")
+                return TranslationResult(
+                    stale, target_language,
+                    source_language=None if source_language == 'auto' else source_language,
+                    cache_hit=True
+                )
         
-        if time_since_last < required_delay:
-            sleep_time = required_delay - time_since_last + random.uniform(0.1, 0.3)
-            logger.info(f"Rate limiting: waiting {sleep_time:.2f}s (attempt {attempt + 1})")
-            await asyncio.sleep(sleep_time)
+        return None
+    
+    def _hedge_delay(self, backend):
+        """How long to wait on a backend before hedging: its p95 latency once enough samples exist"""
+        p95 = backend.latency_percentile(0.95)
+        if p95 is None:
+            return self._hedge_default_delay
+        return max(self._hedge_min_delay, p95)
     
-    def _translate_sync(self, text, target_language, attempt):
+    async def _call_backend(self, backend, text, target_language, attempt, source_language='auto'):
         """
-        Synchronous translation method with improved error handling using deep-translator
+        Translate through one backend, recording its latency
         
         Args:
+            backend (TranslationBackend): Backend to call
             text (str): Text to translate
             target_language (str): Target language code
             attempt (int): Current attempt number
+            source_language (str): Source language code or 'auto'
             
         Returns:
-            str: Translated text or error message
+            TranslationResult: The translation
+            
+        Raises:
+            TranslationError: The backend failed, classified by cause
         """
+        started = time.monotonic()
         try:
-            # Create translator instance for this attempt
-            translator = self._get_translator(target_language)
-            if not translator:
-                return f"[Service unavailable - {target_language.upper()}]"
-            
-            logger.info(f"Attempting translation to {target_language} (attempt {attempt + 1})")
+            logger.info(f"Attempting translation to {target_language} via {backend.name} (attempt {attempt + 1})")
+            translated_text, detected_source = await backend.translate(text, target_language, source_language)
+        except asyncio.CancelledError:
+            backend.record_cancelled(time.monotonic() - started)
+            raise
+        except Exception as e:
+            backend.record_result(time.monotonic() - started, success=False)
+            error = e if isinstance(e, TranslationError) else self._classify_error(e, target_language)
+            self._breakers[backend.name].record_failure(error.category)
+            raise error from e
+        
+        translated_text = translated_text.strip() if isinstance(translated_text, str) else ''
+        if not translated_text:
+            backend.record_result(time.monotonic() - started, success=False)
+            logger.error(f"Translation via {backend.name} returned empty or invalid result")
+            raise EmptyResultError(target_language, detail=f"{backend.name} returned no text")
+        
+        backend.record_result(time.monotonic() - started, success=True)
+        self._breakers[backend.name].record_success()
+        logger.info(f"Successfully translated {detected_source or 'auto'} -> {target_language} via {backend.name}: '{text[:50]}...' -> '{translated_text[:50]}...'")
+        return TranslationResult(
+            translated_text, target_language,
+            source_language=detected_source or (None if source_language == 'auto' else source_language),
+            backend=backend.name
+        )
+    
+    def _prepare_text(self, text):
+        """Strip, length-limit and sanitize text before translation or cache lookup"""
+        text = text.strip()
+        if len(text) > self._max_text_length:
+            text = text[:self._max_text_length] + "..."
             
-            # Attempt translation
-            translated_text = translator.translate(text)
+        # Remove potentially problematic characters
+        return self._sanitize_text(text)
+    
+    def _sanitize_text(self, text):
+        """Remove or replace problematic characters that might cause translation issues"""
+        # Remove excessive whitespace
+        text = ' '.join(text.split())
+        
+        # Remove some problematic Unicode characters that might cause issues
+        problematic_chars = ['\u200b', '\u200c', '\u200d', '\ufeff']
+        for char in problematic_chars:
+            text = text.replace(char, '')
+        
+        return text
+    
+    def _classify_error(self, e, target_language):
+        """
+        Turn a backend exception into a typed translation error
+        
+        Args:
+            e (Exception): Exception raised by the backend
+            target_language (str): Target language code
             
-            if translated_text and isinstance(translated_text, str):
-                translated_text = translated_text.strip()
-                
-                # Validate the translation isn't just the same text (for different languages)
-                if translated_text.lower() == text.lower() and target_language != 'en':
-                    logger.info(f"Translation returned identical text for {target_language} - might not need translation")
-                    # Still return it as it might be correct
-                
-                logger.info(f"Successfully translated to {target_language}: '{text[:50]}...' -> '{translated_text[:50]}...'")
-                return translated_text
-            else:
-                logger.error(f"Translation returned empty or invalid result: {translated_text}")
-                return f"[Translation failed - {target_language.upper()}]"
-                
-        except Exception as e:
-            error_msg = str(e).lower()
-            
-            # Handle specific known errors
-            if 'timeout' in error_msg or 'connection' in error_msg:
-                logger.error(f"Connection/timeout error on attempt {attempt + 1}: {e}")
-                return f"[Connection timeout - {target_language.upper()}]"
-            elif 'rate limit' in error_msg or '429' in error_msg:
-                logger.error(f"Rate limit hit on attempt {attempt + 1}: {e}")
-                return f"[Rate limited - {target_language.upper()}]"
-            elif 'quota' in error_msg or 'limit exceeded' in error_msg:
-                logger.error(f"Quota exceeded on attempt {attempt + 1}: {e}")
-                return f"[Quota exceeded - {target_language.upper()}]"
-            elif 'unsupported' in error_msg or 'invalid' in error_msg:
-                logger.error(f"Unsupported language on attempt {attempt + 1}: {e}")
-                return f"[Unsupported language - {target_language.upper()}]"
-            else:
-                logger.error(f"Translation error on attempt {attempt + 1}: {e}")
-                return f"[Translation error - {target_language.upper()}]"
+        Returns:
+            TranslationError: Error whose type says whether a retry can help
+        """
+        error_msg = f"{type(e).__name__} {e}".lower()
+        
+        # Handle specific known errors
+        if isinstance(e, (TimeoutError, ConnectionError)) or 'timeout' in error_msg or 'connection' in error_msg:
+            error_class = TranslationTimeoutError
+        elif 'rate limit' in error_msg or '429' in error_msg or 'toomanyrequests' in error_msg or 'too many requests' in error_msg:
+            error_class = RateLimitedError
+        elif 'quota' in error_msg or 'limit exceeded' in error_msg:
+            error_class = QuotaExceededError
+        elif 'unsupported' in error_msg or 'notsupported' in error_msg or 'invalid' in error_msg:
+            error_class = UnsupportedLanguageError
+        else:
+            error_class = TranslationError
+        
+        return error_class(target_language, detail=str(e))
     
     async def detect_language(self, text):
         """
-        Detect the language of given text with retry logic
+        Detect the language of given text, locally first and then with the detection service
         
         Args:
             text (str): Text to analyze
@@ -188,15 +895,22 @@ class TranslationService:
         if not text or not text.strip():
             return None
         
+        if self._identifier:
+            detected = self._identifier.detect(text)
+            if detected:
+                return detected
+        
+        # deep-translator's detection service needs an API key; without one every
+        # attempt fails locally, so don't spend rate limit tokens on it
+        if not self._detect_api_key:
+            return None
+        
         text = self._sanitize_text(text[:500])  # Limit text length for detection
         
         for attempt in range(2):  # Fewer retries for detection
             try:
-                await self._apply_rate_limit(attempt)
-                
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self._detect_language_sync, text
-                )
+                async with self._limiter:
+                    result = await self._executor.run(self._detect_language_sync, text)
                 
                 if result:
                     return result
@@ -222,7 +936,7 @@ class TranslationService:
             from deep_translator import single_detection
             
             # Detect language
-            detected = single_detection(text, api_key=None)
+            detected = single_detection(text, api_key=self._detect_api_key)
             
             if detected and detected != 'unknown':
                 return detected
@@ -233,41 +947,44 @@ class TranslationService:
             logger.error(f"Language detection error: {e}")
             return None
     
-    async def get_supported_languages(self):
+    async def load_supported_languages(self):
         """
-        Get list of supported languages from deep-translator
+        Load the backend's language table once, keeping the bundled snapshot if it cannot be loaded
         
         Returns:
-            dict: Dictionary of language codes and names
+            bool: True if the live table is in use
         """
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, self._get_supported_languages_sync
-            )
-            
-            return result or {}
+        if self._languages.origin == 'backend':
+            return True
+        
+        languages = await self._executor.run(load_backend_languages)
+        if not languages:
+            logger.warning("Using the bundled language table")
+            return False
+        
+        self._languages.update(languages, origin='backend')
+        return True
+    
+    def is_supported_language(self, language_code):
+        """
+        Check whether text can be translated into a language
+        
+        Args:
+            language_code (str): Target language code
             
-        except Exception as e:
-            logger.error(f"Error getting supported languages: {e}")
-            return {}
+        Returns:
+            bool: True if the backend supports the language
+        """
+        return self._languages.normalize(language_code) is not None
     
-    def _get_supported_languages_sync(self):
+    def get_supported_languages(self):
         """
-        Synchronous method to get supported languages from deep-translator
+        Get the languages the backend can translate to
         
         Returns:
             dict: Dictionary of language codes and names
         """
-        try:
-            from deep_translator import GoogleTranslator
-            
-            # Get supported languages
-            languages = GoogleTranslator.get_supported_languages(as_dict=True)
-            return languages
-            
-        except Exception as e:
-            logger.error(f"Error getting supported languages sync: {e}")
-            return {}
+        return self._languages.get_languages()
     
     def get_service_status(self):
         """
@@ -277,10 +994,40 @@ class TranslationService:
             dict: Service status information
         """
         return {
-            'service': 'Google Translate (via deep-translator)',
-            'rate_limit_delay': self._rate_limit_delay,
+            'service': 'Google Translate',
+            'rate_limiter': self._limiter.get_stats(),
+            'executor': self._executor.get_stats(),
+            'backends': [backend.get_stats() for backend in self._backends],
+            'circuit_breakers': {name: breaker.get_stats() for name, breaker in self._breakers.items()},
+            'hedged_requests': self._hedged_requests,
+            'hedge_wins': self._hedge_wins,
+            'deadline_exceeded': self._deadline_exceeded,
             'retry_attempts': self._retry_attempts,
             'max_text_length': self._max_text_length,
-            'last_request_time': self._last_request_time,
-            'backend': 'deep-translator'
+            'chunk_max_length': self._chunk_max_length,
+            'chunked_translations': self._chunked_translations,
+            'backend': self._backends[0].name,
+            'cache': self._cache.get_stats() if self._cache else None,
+            'segment_memory': {
+                'enabled': self._segment_memory,
+                'hits': self._segment_hits,
+                'misses': self._segment_misses,
+                'misaligned': self._segment_misaligned,
+            },
+            'near_duplicates': self._near_duplicates.get_stats() if self._near_duplicates else None,
+            'batcher': self._batcher.get_stats() if self._batcher else None,
+            'inflight_requests': len(self._inflight),
+            'coalesced_requests': self._coalesced_requests,
+            'language_identifier': self._identifier.get_stats() if self._identifier else None,
+            'language_registry': self._languages.get_stats(),
+            'same_language_skips': self._same_language_skips,
+            'prefetched': self._prefetched
         }
+    
+    async def close(self):
+        """Release backend resources, the executor threads and the cache's disk tier"""
+        for backend in self._backends:
+            await backend.close()
+        self._executor.shutdown()
+        if self._cache:
+            self._cache.close()
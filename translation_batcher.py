@@ -0,0 +1,138 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Sanitized texts never contain newlines, so a newline safely separates batched texts
+BATCH_DELIMITER = '\n'
+
+class TranslationBatcher:
+    """Collects short texts headed for the same language pair and sends them as one backend request"""
+
+    def __init__(self, send_request, window=0.15, max_items=16, max_chars=4500):
+        """
+        Args:
+            send_request: Coroutine function (text, target_language, source_language) -> TranslationResult,
+                raising TranslationError on failure
+            window (float): Seconds to wait for more texts before sending a batch
+            max_items (int): Maximum texts per batch
+            max_chars (int): Maximum characters per batch request, delimiters included
+        """
+        self._send_request = send_request
+        self._window = window
+        self._max_items = max_items
+        self._max_chars = max_chars
+        self._pending = {}  # (target_language, source_language) -> [(text, future), ...]
+        self._timers = {}  # (target_language, source_language) -> TimerHandle
+        self._stats = {
+            'batches_sent': 0,
+            'texts_batched': 0,
+            'split_fallbacks': 0,
+            'batches_abandoned': 0,
+        }
+
+    async def submit(self, text, target_language, source_language='auto'):
+        """
+        Queue a text for the next batch to its language pair
+
+        Args:
+            text (str): Sanitized text without newlines
+            target_language (str): Target language code
+            source_language (str): Source language code or 'auto'
+
+        Returns:
+            TranslationResult: Backend result for this text, or None if the batch could
+                not be split back apart and the caller should send the text on its own
+            
+        Raises:
+            TranslationError: The batch request failed
+        """
+        key = (target_language, source_language)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(key, [])
+        batch_chars = sum(len(queued) + len(BATCH_DELIMITER) for queued, _ in batch)
+        if batch and batch_chars + len(text) > self._max_chars:
+            self._flush(key)
+
+        self._pending.setdefault(key, []).append((text, future))
+
+        if len(self._pending[key]) >= self._max_items:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self._window, self._flush, key)
+
+        return await future
+
+    def _flush(self, key):
+        """Send whatever is queued for a language pair"""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        # Callers that gave up while the batch was filling are left out of it
+        batch = [(text, future) for text, future in self._pending.pop(key, ()) if not future.done()]
+        if batch:
+            asyncio.create_task(self._send_batch(key, batch))
+
+    async def _send_batch(self, key, batch):
+        """Send one batch request and hand each caller its share of the result"""
+        target_language, source_language = key
+        texts = [text for text, _ in batch]
+        results = [None] * len(batch)
+
+        request = asyncio.ensure_future(self._send_request(BATCH_DELIMITER.join(texts), target_language, source_language))
+
+        # Once every caller has given up, nobody wants the answer: stop waiting on the limiter and backend
+        def abandon_if_unwanted(_):
+            if not request.done() and all(future.done() for _, future in batch):
+                request.cancel()
+
+        for _, future in batch:
+            future.add_done_callback(abandon_if_unwanted)
+
+        try:
+            response = await request
+        except asyncio.CancelledError:
+            if not all(future.done() for _, future in batch):
+                raise
+            self._stats['batches_abandoned'] += 1
+            logger.info(f"Every caller gave up on a batch of {len(batch)} texts to {target_language}, dropping it")
+            return
+        except Exception as e:
+            logger.error(f"Batch translation to {target_language} failed: {e}")
+            # Every caller gets the failure, so each retry loop can decide whether to try again
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._stats['batches_sent'] += 1
+        self._stats['texts_batched'] += len(texts)
+
+        if len(batch) == 1:
+            results = [response]
+        else:
+            parts = [part.strip() for part in response.text.split(BATCH_DELIMITER)]
+            if len(parts) == len(batch) and all(parts):
+                results = [response.replace(text=part) for part in parts]
+            else:
+                self._stats['split_fallbacks'] += 1
+                logger.warning(f"Batch of {len(batch)} texts to {target_language} came back as {len(parts)} parts, sending individually")
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self):
+        """
+        Get batching counters
+
+        Returns:
+            dict: Batcher statistics
+        """
+        stats = dict(self._stats)
+        stats['window'] = self._window
+        stats['pending_texts'] = sum(len(batch) for batch in self._pending.values())
+        return stats
@@ -0,0 +1,309 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class TranslationCache:
+    """
+    Two-tier translation cache: in-memory LRU backed by a SQLite file that survives restarts
+
+    The memory tier is checked on the event loop. SQLite only runs on the cache's own
+    disk thread: lookups that miss memory are awaited there, and writes are queued and
+    committed together a moment later, so neither blocks the event loop.
+    """
+
+    def __init__(self, max_entries=2048, ttl=3600, db_path=None, disk_ttl=7 * 24 * 3600, write_delay=1.0):
+        """
+        Args:
+            max_entries (int): Maximum number of entries kept in the memory tier
+            ttl (float): Seconds an entry stays valid in the memory tier
+            db_path (str): SQLite file for the disk tier, or None for memory only
+            disk_ttl (float): Seconds an entry stays valid in the disk tier
+            write_delay (float): Seconds writes are collected before being committed to disk together
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._disk_ttl = disk_ttl
+        self._write_delay = write_delay
+        self._memory = OrderedDict()  # key -> (translation, expires_at)
+        self._lock = threading.Lock()
+        self._db = None
+        self._disk = None  # Single thread that owns every SQLite call
+        self._pending_writes = {}  # key -> (key, target, backend, translation, created_at) not yet on disk
+        self._flush_handle = None
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stale_hits': 0,
+            'writes': 0,
+            'evictions': 0,
+            'disk_flushes': 0,
+        }
+
+        if db_path:
+            self._open_disk_tier(db_path)
+        if self._db:
+            self._disk = ThreadPoolExecutor(max_workers=1, thread_name_prefix='echolang-cache')
+
+    def _open_disk_tier(self, db_path):
+        """Open (or create) the SQLite disk tier, falling back to memory only on failure"""
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'key TEXT PRIMARY KEY, '
+                'target TEXT NOT NULL, '
+                'backend TEXT NOT NULL, '
+                'translation TEXT NOT NULL, '
+                'created_at REAL NOT NULL)'
+            )
+            # Drop anything that expired while the bot was offline
+            self._db.execute(
+                'DELETE FROM translations WHERE created_at < ?',
+                (time.time() - self._disk_ttl,)
+            )
+            self._db.commit()
+            logger.info(f"Translation cache disk tier opened at {db_path}")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open translation cache at {db_path}, using memory only: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(text, target_language, backend):
+        """
+        Build the cache key for a translation
+
+        Args:
+            text (str): Source text
+            target_language (str): Target language code
+            backend (str): Name of the translation backend
+
+        Returns:
+            str: Hex digest identifying the (text, target, backend) triple
+        """
+        normalized = unicodedata.normalize('NFC', ' '.join(text.split()))
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return f"{backend}:{target_language}:{digest}"
+
+    async def get(self, text, target_language, backends):
+        """
+        Look up a cached translation, checking memory first and then disk
+
+        Args:
+            text (str): Source text
+            target_language (str): Target language code
+            backends (list): Names of the backends whose translations are accepted, most preferred first
+
+        Returns:
+            str: Cached translation or None on a miss
+        """
+        return (await self.get_many([text], target_language, backends))[0]
+
+    async def get_many(self, texts, target_language, backends):
+        """
+        Look up several cached translations, reading every memory miss from disk in one go
+
+        Args:
+            texts (list): Source texts
+            target_language (str): Target language code
+            backends (list): Names of the backends whose translations are accepted, most preferred first
+
+        Returns:
+            list: Cached translation or None for each text
+        """
+        keys = [[self.make_key(text, target_language, backend) for backend in backends] for text in texts]
+        now = time.time()
+        translations = [None] * len(keys)
+        misses = []
+
+        with self._lock:
+            for index, candidates in enumerate(keys):
+                # Expired entries stay until evicted so get_stale() can still serve them
+                key = next((key for key in candidates if self._memory.get(key, (None, 0))[1] > now), None)
+                if key is None:
+                    misses.append(index)
+                    continue
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                translations[index] = self._memory[key][0]
+
+        if misses:
+            found = await self._read_disk([key for index in misses for key in keys[index]], now - self._disk_ttl)
+            with self._lock:
+                for index in misses:
+                    key = next((key for key in keys[index] if key in found), None)
+                    if key is None:
+                        self._stats['misses'] += 1
+                        continue
+                    self._stats['disk_hits'] += 1
+                    self._set_memory(key, found[key], now)
+                    translations[index] = found[key]
+
+        return translations
+
+    async def get_stale(self, text, target_language, backends):
+        """
+        Look up a translation ignoring expiry, for use when no backend can be reached
+
+        Returns:
+            str: Cached translation, possibly expired, or None
+        """
+        keys = [self.make_key(text, target_language, backend) for backend in backends]
+
+        with self._lock:
+            translation = next((self._memory[key][0] for key in keys if key in self._memory), None)
+        if translation is None:
+            found = await self._read_disk(keys, float('-inf'))
+            translation = next((found[key] for key in keys if key in found), None)
+        if translation is not None:
+            with self._lock:
+                self._stats['stale_hits'] += 1
+        return translation
+
+    async def contains(self, text, target_language, backends):
+        """Check whether a non-expired translation is cached without touching the hit/miss counters"""
+        keys = [self.make_key(text, target_language, backend) for backend in backends]
+        now = time.time()
+
+        with self._lock:
+            if any(self._memory.get(key, (None, 0))[1] > now for key in keys):
+                return True
+        return bool(await self._read_disk(keys, now - self._disk_ttl))
+
+    def set(self, text, target_language, backend, translation):
+        """Store a successful translation in memory now and on disk with the next batch of writes"""
+        key = self.make_key(text, target_language, backend)
+        now = time.time()
+
+        with self._lock:
+            self._set_memory(key, translation, now)
+            self._stats['writes'] += 1
+            if not self._disk:
+                return
+            self._pending_writes[key] = (key, target_language, backend, translation, now)
+
+        if self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._disk.submit(self._flush_writes)
+                return
+            self._flush_handle = loop.call_later(self._write_delay, self._start_flush)
+
+    def _set_memory(self, key, translation, now):
+        """Insert into the memory tier and evict least recently used entries (lock held)"""
+        self._memory[key] = (translation, now + self._ttl)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    async def _read_disk(self, keys, created_after):
+        """
+        Read entries from the disk tier on the disk thread, including writes not yet flushed
+
+        Args:
+            keys (list): Cache keys
+            created_after (float): Oldest creation time still accepted
+
+        Returns:
+            dict: Key -> translation for the keys found
+        """
+        if not self._disk:
+            return {}
+
+        found = {}
+        with self._lock:
+            for key in keys:
+                pending = self._pending_writes.get(key)
+                if pending is not None:
+                    found[key] = pending[3]
+        unread = [key for key in keys if key not in found]
+        if unread:
+            loop = asyncio.get_running_loop()
+            found.update(await loop.run_in_executor(self._disk, self._select, unread, created_after))
+        return found
+
+    def _select(self, keys, created_after):
+        """Read entries from SQLite (disk thread)"""
+        placeholders = ', '.join('?' * len(keys))
+        try:
+            rows = self._db.execute(
+                f'SELECT key, translation FROM translations WHERE key IN ({placeholders}) AND created_at >= ?',
+                (*keys, created_after)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache disk read failed: {e}")
+            return {}
+
+        return dict(rows)
+
+    def _start_flush(self):
+        """Hand the queued writes to the disk thread"""
+        self._flush_handle = None
+        self._disk.submit(self._flush_writes)
+
+    def _flush_writes(self):
+        """Write every queued entry to SQLite in one transaction (disk thread)"""
+        with self._lock:
+            rows = list(self._pending_writes.values())
+        if not rows:
+            return
+
+        try:
+            self._db.executemany(
+                'INSERT OR REPLACE INTO translations (key, target, backend, translation, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache disk write of {len(rows)} entries failed: {e}")
+
+        # Entries rewritten while this batch was committing stay queued for the next one
+        with self._lock:
+            for row in rows:
+                if self._pending_writes.get(row[0]) is row:
+                    del self._pending_writes[row[0]]
+            self._stats['disk_flushes'] += 1
+
+    def get_stats(self):
+        """
+        Get cache hit/miss counters
+
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['memory_hits'] + stats['disk_hits']) / lookups, 3) if lookups else 0.0
+        stats['disk_enabled'] = self._db is not None
+        stats['pending_disk_writes'] = len(self._pending_writes)
+        return stats
+
+    def close(self):
+        """Write out queued entries and close the disk tier"""
+        if not self._disk:
+            return
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._disk.submit(self._flush_writes)
+        self._disk.submit(self._db.close)
+        self._disk.shutdown(wait=True)
+        self._disk = None
+        self._db = None
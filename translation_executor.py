@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class TranslationExecutor:
+    """Bounded, named thread pool for blocking translation calls with queue-depth and wait-time metrics"""
+
+    def __init__(self, max_workers=4, name='echolang-translate'):
+        """
+        Args:
+            max_workers (int): Number of worker threads
+            name (str): Thread name prefix, visible in thread dumps and logs
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._max_workers = max_workers
+        self._name = name
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, func, *args):
+        """
+        Run a blocking function on the pool from the running event loop
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+
+        Returns:
+            The return value of func
+        """
+        submitted = time.monotonic()
+
+        def call():
+            waited = time.monotonic() - submitted
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+
+        future = self._executor.submit(call)
+        try:
+            return await asyncio.wrap_future(future, loop=asyncio.get_running_loop())
+        except asyncio.CancelledError:
+            # A job cancelled before it started never runs, so it leaves the queue here
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def get_stats(self):
+        """
+        Get pool size, queue depth and wait-time metrics
+
+        Returns:
+            dict: Executor statistics
+        """
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                'name': self._name,
+                'max_workers': self._max_workers,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self._completed,
+                'avg_wait': round(self._total_wait / started, 3) if started else 0.0,
+                'max_wait': round(self._max_wait, 3),
+            }
+
+    def shutdown(self, wait=False):
+        """Stop accepting work and release the worker threads"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,109 @@
+class TranslationResult:
+    """Outcome of a translation request that did not fail"""
+
+    def __init__(self, text, target_language, source_language=None, backend=None,
+                 latency=0.0, cache_hit=False, notice=None):
+        """
+        Args:
+            text (str): Translated text, or the original text when nothing was translated
+            target_language (str): Target language code
+            source_language (str): Detected or given source language code, if known
+            backend (str): Name of the backend that produced the text, if any
+            latency (float): Seconds the caller waited for the result
+            cache_hit (bool): Whether the text came from the translation cache
+            notice (str): Why the text was not translated (e.g. "Already in English"), or None
+        """
+        self.text = text
+        self.target_language = target_language
+        self.source_language = source_language
+        self.backend = backend
+        self.latency = latency
+        self.cache_hit = cache_hit
+        self.notice = notice
+
+    @property
+    def translated(self):
+        """Whether the text is an actual translation rather than a notice"""
+        return self.notice is None
+
+    def replace(self, **changes):
+        """
+        Copy the result with some fields changed
+
+        Returns:
+            TranslationResult: The new result
+        """
+        fields = dict(vars(self))
+        fields.update(changes)
+        return TranslationResult(**fields)
+
+    def __repr__(self):
+        return (f"TranslationResult(target={self.target_language!r}, source={self.source_language!r}, "
+                f"backend={self.backend!r}, cache_hit={self.cache_hit}, notice={self.notice!r}, "
+                f"latency={self.latency:.3f}, text={self.text[:40]!r})")
+
+class TranslationError(Exception):
+    """Base class for translation failures"""
+
+    # Failure category, used by circuit breakers and stats
+    category = 'error'
+    # Whether trying the same request again may succeed
+    retryable = True
+    # User-facing description of the failure
+    description = 'Translation error'
+
+    def __init__(self, target_language, detail=None):
+        """
+        Args:
+            target_language (str): Target language code
+            detail (str): Underlying error, for logs
+        """
+        self.target_language = target_language
+        self.detail = detail
+        super().__init__(f"{self.description} - {target_language.upper()}")
+
+class TranslationTimeoutError(TranslationError):
+    """The backend did not answer in time or the connection failed"""
+
+    category = 'timeout'
+    description = 'Connection timeout'
+
+class RateLimitedError(TranslationError):
+    """The backend is throttling requests"""
+
+    category = 'rate_limit'
+    description = 'Rate limited'
+
+class QuotaExceededError(TranslationError):
+    """The backend's usage quota is used up; retrying now cannot help"""
+
+    category = 'quota'
+    retryable = False
+    description = 'Quota exceeded'
+
+class UnsupportedLanguageError(TranslationError):
+    """The backend cannot translate this language pair"""
+
+    category = 'unsupported'
+    retryable = False
+    description = 'Unsupported language'
+
+class EmptyResultError(TranslationError):
+    """The backend answered without any translated text"""
+
+    category = 'empty'
+    description = 'Translation failed'
+
+class ServiceUnavailableError(TranslationError):
+    """No backend can take requests right now (every circuit breaker is open)"""
+
+    category = 'unavailable'
+    retryable = False
+    description = 'Service unavailable'
+
+class DeadlineExceededError(TranslationError):
+    """The request's time budget ran out before a translation arrived"""
+
+    category = 'deadline'
+    retryable = False
+    description = 'Timed out'
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+
+class MinimalUser:
+    """Stand-in for a discord user when only their ID and names are known"""
+
+    __slots__ = ('id', 'name', 'display_name', 'bot')
+
+    def __init__(self, user_id, name=None, display_name=None, bot=False):
+        """
+        Args:
+            user_id (int): Discord user ID
+            name (str): Username, or None if unknown
+            display_name (str): Name shown in embed footers, defaults to the username
+            bot (bool): Whether the user is a bot
+        """
+        self.id = user_id
+        self.name = name or f"User_{user_id}"
+        self.display_name = display_name or self.name
+        self.bot = bot
+
+class UserNameCache:
+    """Bounded LRU of user names, so reactions can be attributed without a fetch_user call"""
+
+    def __init__(self, max_entries=10000):
+        """
+        Args:
+            max_entries (int): Users remembered; the least recently used is dropped
+        """
+        self._max_entries = max_entries
+        self._users = OrderedDict()  # user_id -> (name, display_name, bot)
+        self._hits = 0
+        self._misses = 0
+
+    def remember(self, user):
+        """
+        Remember a user's names
+
+        Args:
+            user (discord.abc.User): User or member
+        """
+        self._users[user.id] = (user.name, user.display_name, user.bot)
+        self._users.move_to_end(user.id)
+        if len(self._users) > self._max_entries:
+            self._users.popitem(last=False)
+
+    def get(self, user_id):
+        """
+        Get a remembered user
+
+        Args:
+            user_id (int): Discord user ID
+
+        Returns:
+            MinimalUser: The user, or None if their names are not known
+        """
+        entry = self._users.get(user_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._users.move_to_end(user_id)
+        name, display_name, bot = entry
+        return MinimalUser(user_id, name, display_name, bot)
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Size, hits and misses
+        """
+        return {
+            'size': len(self._users),
+            'max_entries': self._max_entries,
+            'hits': self._hits,
+            'misses': self._misses,
+        }